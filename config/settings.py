@@ -21,7 +21,48 @@ WINDOW_HEIGHT = 900
 
 # Tailles des chunks pour upload/download
 UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB
+LARGE_UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024  # 8MB (multiple de 256KB exigé par Drive)
+LARGE_UPLOAD_THRESHOLD = 8 * 1024 * 1024  # Fichiers au-delà: chunks de LARGE_UPLOAD_CHUNK_SIZE
 DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB
+# En dessous de ce seuil: upload multipart (métadonnées + contenu en une requête)
+SMALL_UPLOAD_THRESHOLD = 5 * 1024 * 1024  # 5MB
+
+# Téléchargement en parties parallèles (requêtes HTTP Range) pour les gros fichiers
+PARALLEL_DOWNLOAD_THRESHOLD = 16 * 1024 * 1024  # 16MB
+DOWNLOAD_PART_SIZE = 8 * 1024 * 1024  # 8MB
+PARALLEL_DOWNLOAD_WORKERS = 4
+
+# Taille maximale d'un fichier lu en mémoire à l'avance pendant l'upload du précédent
+PREFETCH_MAX_FILE_SIZE = 32 * 1024 * 1024  # 32MB
+
+# Uploads de dossiers: au-delà de ce seuil un fichier est "gros" et le nombre de
+# gros fichiers envoyés simultanément est limité (les petits occupent le reste)
+LARGE_FILE_THRESHOLD = 16 * 1024 * 1024  # 16MB
+LARGE_FILE_MAX_PARALLEL = 4
+# Plafond de la fenêtre adaptative des uploads de dossiers (elle démarre à max_parallel_uploads)
+ADAPTIVE_UPLOAD_MAX_PARALLEL = 16
+
+# Pool de connexions de la session HTTP partagée (keep-alive)
+HTTP_POOL_CONNECTIONS = 32
+HTTP_POOL_MAXSIZE = 64
+
+# Nombre maximum de requêtes par batch HTTP de l'API Drive
+DRIVE_BATCH_MAX_REQUESTS = 100
+
+# Requêtes de listing/vérification d'existence simultanées vers l'API Drive (tous threads confondus)
+DRIVE_API_MAX_CONCURRENCY = 8
+
+# Durée de validité (secondes) et taille du cache des vérifications d'existence
+EXISTS_CACHE_TTL = 60
+EXISTS_CACHE_MAX_SIZE = 10000
+# Listings complets de dossiers gardés en mémoire pour ces vérifications
+FOLDER_LISTING_CACHE_TTL = 30
+FOLDER_LISTING_CACHE_MAX_FOLDERS = 256
+
+# Chargements de listings (local et Drive) exécutés en parallèle dans le pool dédié
+FILE_LOAD_MAX_THREADS = 4
+# Nombre d'entrées d'un dossier local lues entre deux vérifications d'annulation
+FILE_LOAD_CANCEL_CHECK_INTERVAL = 64
 
 # Paramètres d'upload par défaut
 DEFAULT_NUM_WORKERS = 2
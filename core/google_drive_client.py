@@ -2,32 +2,47 @@
 Client pour interagir avec l'API Google Drive
 """
 
+import io
 import os
 import pickle
-from typing import List, Dict, Any, Optional
+import mimetypes
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
 from googleapiclient.discovery import build
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
-from googleapiclient.http import MediaFileUpload, MediaIoBaseDownload
+from googleapiclient.http import MediaFileUpload, MediaIoBaseUpload, MediaIoBaseDownload
 from PyQt5.QtCore import pyqtSignal
 
-from config.settings import SCOPES, get_credentials_path, get_token_path, UPLOAD_CHUNK_SIZE
+from config.settings import (SCOPES, get_credentials_path, get_token_path, UPLOAD_CHUNK_SIZE,
+                             LARGE_UPLOAD_CHUNK_SIZE, LARGE_UPLOAD_THRESHOLD, SMALL_UPLOAD_THRESHOLD,
+                             DRIVE_BATCH_MAX_REQUESTS, DOWNLOAD_CHUNK_SIZE, DOWNLOAD_PART_SIZE,
+                             PARALLEL_DOWNLOAD_WORKERS)
+from core.shared_session import get_shared_session, reset_shared_session
 
 
 class GoogleDriveClient:
     """Client pour gérer les interactions avec l'API Google Drive"""
 
-    def __init__(self):
-        """Initialise le client Google Drive"""
-        self.service = self._get_drive_service()
+    def __init__(self, credentials=None):
+        """
+        Initialise le client Google Drive
+
+        Args:
+            credentials: Credentials OAuth déjà chargés (optionnel). Si absents,
+                ils sont lus depuis le token sur disque.
+        """
+        self.service = self._get_drive_service(credentials)
         self.shared_drives_cache: Dict[str, bool] = {}
 
-    def _get_drive_service(self):
+    @staticmethod
+    def load_credentials():
         """
-        Authentifie et retourne le service Google Drive
+        Charge les credentials OAuth depuis le disque, avec rafraîchissement si nécessaire
 
         Returns:
-            Service Google Drive authentifié
+            Credentials OAuth valides
         """
         creds = None
         token_path = get_token_path()
@@ -50,10 +65,32 @@ class GoogleDriveClient:
             with open(token_path, 'wb') as token:
                 pickle.dump(creds, token)
 
-        return build('drive', 'v3', credentials=creds)
+        return creds
+
+    def _get_drive_service(self, credentials=None):
+        """
+        Authentifie et retourne le service Google Drive
+
+        Args:
+            credentials: Credentials OAuth déjà chargés (optionnel)
+
+        Returns:
+            Service Google Drive authentifié
+        """
+        if credentials is None:
+            credentials = self.load_credentials()
+        self._credentials = credentials
+        return build('drive', 'v3', credentials=credentials)
+
+    @property
+    def credentials(self):
+        """Credentials OAuth utilisés par ce client"""
+        return self._credentials
 
     def disconnect(self) -> None:
         """Se déconnecte de Google Drive en supprimant les tokens"""
+        # La session HTTP partagée reste liée aux credentials de ce compte
+        reset_shared_session()
         token_files = [get_token_path(), 'token.pickle']
         for token_file in token_files:
             if os.path.exists(token_file):
@@ -253,19 +290,131 @@ class GoogleDriveClient:
 
         return file_path
 
+    def download_file_parallel(self, file_id: str, file_name: str, local_dir: str,
+                               progress_callback=None,
+                               max_workers: int = PARALLEL_DOWNLOAD_WORKERS) -> str:
+        """
+        Télécharge un gros fichier en plusieurs parties simultanées (requêtes HTTP Range)
+
+        Les parties passent par la session HTTP partagée (connexions keep-alive
+        réutilisées) et chaque partie est écrite directement à son offset dans
+        le fichier préalloué.
+
+        Args:
+            file_id: ID du fichier à télécharger
+            file_name: Nom du fichier
+            local_dir: Dossier de destination
+            progress_callback: Fonction(progress: int) appelée avec le progrès (0-100)
+            max_workers: Nombre de parties téléchargées simultanément
+
+        Returns:
+            Chemin du fichier téléchargé
+
+        Raises:
+            IOError: Si une partie n'est pas une réponse 206 de la taille demandée
+        """
+        metadata = self.service.files().get(
+            fileId=file_id,
+            fields="size",
+            supportsAllDrives=True
+        ).execute()
+        file_size = int(metadata.get('size', 0))
+        file_path = os.path.join(local_dir, file_name)
+
+        # Préallouer le fichier pour que chaque partie écrive à son offset
+        with open(file_path, 'wb') as f:
+            f.truncate(file_size)
+
+        if file_size == 0:
+            return file_path
+
+        ranges = [(start, min(start + DOWNLOAD_PART_SIZE, file_size) - 1)
+                  for start in range(0, file_size, DOWNLOAD_PART_SIZE)]
+        session = get_shared_session(self._credentials)
+        media_url = f"https://www.googleapis.com/drive/v3/files/{file_id}"
+        progress_lock = threading.Lock()
+        downloaded = 0
+
+        def download_part(byte_range: Tuple[int, int]) -> None:
+            nonlocal downloaded
+            start, end = byte_range
+            expected = end - start + 1
+            with session.get(
+                media_url,
+                params={'alt': 'media', 'supportsAllDrives': 'true'},
+                headers={'Range': f"bytes={start}-{end}"},
+                stream=True,
+                timeout=60
+            ) as response:
+                response.raise_for_status()
+                # Un 200 renverrait le fichier entier, écrit à tort à l'offset de la partie
+                if response.status_code != 206:
+                    raise IOError(f"Réponse {response.status_code} au lieu de 206 pour la partie "
+                                  f"{start}-{end} de {file_name}")
+
+                received = 0
+                with open(file_path, 'r+b') as f:
+                    f.seek(start)
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        received += len(chunk)
+                        if received > expected:
+                            break
+                        f.write(chunk)
+                        with progress_lock:
+                            downloaded += len(chunk)
+                            progress = int(downloaded * 100 / file_size)
+                        if progress_callback:
+                            progress_callback(progress)
+
+            # Partie incomplète ou trop longue: le fichier préalloué serait corrompu
+            if received != expected:
+                raise IOError(f"Partie {start}-{end} de {file_name}: {received} octets reçus "
+                              f"au lieu de {expected}")
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # list() pour propager la première exception éventuelle
+            list(executor.map(download_part, ranges))
+
+        return file_path
+
+    @staticmethod
+    def _upload_chunk_size(file_size: int) -> int:
+        """
+        Taille de chunk pour un upload resumable
+
+        Drive impose des chunks envoyés dans l'ordre: pour les gros fichiers, des
+        chunks plus grands réduisent le nombre d'allers-retours séquentiels.
+
+        Args:
+            file_size: Taille du fichier en bytes
+
+        Returns:
+            Taille de chunk en bytes
+        """
+        if file_size > LARGE_UPLOAD_THRESHOLD:
+            return LARGE_UPLOAD_CHUNK_SIZE
+        return UPLOAD_CHUNK_SIZE
+
     def upload_file(self, file_path: str, parent_id: str = 'root',
                     progress_callback: Optional[pyqtSignal] = None,
                     status_callback: Optional[pyqtSignal] = None,
-                    is_shared_drive: bool = False) -> str:
+                    is_shared_drive: bool = False,
+                    data: Optional[bytes] = None) -> str:
         """
         Upload un fichier vers Google Drive
 
+        Sans contenu préchargé, le fichier est lu directement depuis le disque
+        chunk par chunk pendant l'envoi: sa taille n'impacte pas la mémoire.
+        Les petits fichiers (< SMALL_UPLOAD_THRESHOLD) sont envoyés en une seule
+        requête multipart au lieu d'une initialisation resumable suivie du contenu.
+
         Args:
             file_path: Chemin du fichier local
             parent_id: ID du dossier parent
             progress_callback: Callback pour le progrès
             status_callback: Callback pour le statut
             is_shared_drive: True si c'est un Shared Drive
+            data: Contenu du fichier déjà lu en mémoire (optionnel)
 
         Returns:
             ID du fichier uploadé
@@ -279,7 +428,21 @@ class GoogleDriveClient:
         if status_callback:
             status_callback.emit(f"⬆️ Upload: {file_name}")
 
-        media = MediaFileUpload(file_path, resumable=True, chunksize=UPLOAD_CHUNK_SIZE)
+        file_size = len(data) if data is not None else os.path.getsize(file_path)
+        # Petit fichier: un seul aller-retour (uploadType=multipart)
+        resumable = file_size >= SMALL_UPLOAD_THRESHOLD
+
+        if data is not None:
+            # Contenu préchargé: pas de nouvelle lecture disque
+            media = MediaIoBaseUpload(
+                io.BytesIO(data),
+                mimetype=mimetypes.guess_type(file_path)[0] or 'application/octet-stream',
+                resumable=resumable,
+                chunksize=self._upload_chunk_size(file_size)
+            )
+        else:
+            media = MediaFileUpload(file_path, resumable=resumable,
+                                    chunksize=self._upload_chunk_size(file_size))
 
         try:
             request = self.service.files().create(
@@ -296,15 +459,18 @@ class GoogleDriveClient:
                 fields='id'
             )
 
+        if not resumable:
+            response = request.execute()
+            if progress_callback:
+                progress_callback.emit(100)
+            return response.get('id')
+
         response = None
-        file_size = os.path.getsize(file_path)
-        uploaded = 0
 
         while response is None:
             status, response = request.next_chunk()
             if status:
-                uploaded += UPLOAD_CHUNK_SIZE
-                progress = min(int((uploaded / file_size) * 100), 100)
+                progress = min(int((status.resumable_progress / file_size) * 100), 100)
                 if progress_callback:
                     progress_callback.emit(progress)
 
@@ -330,7 +496,8 @@ class GoogleDriveClient:
             'parents': [parent_id]
         }
 
-        media = MediaFileUpload(file_path, resumable=True, chunksize=UPLOAD_CHUNK_SIZE)
+        file_size = os.path.getsize(file_path)
+        media = MediaFileUpload(file_path, resumable=True, chunksize=self._upload_chunk_size(file_size))
 
         try:
             request = self.service.files().create(
@@ -348,15 +515,12 @@ class GoogleDriveClient:
             )
 
         response = None
-        file_size = os.path.getsize(file_path)
-        uploaded = 0
 
         while response is None:
             try:
                 status, response = request.next_chunk()
                 if status:
-                    uploaded += UPLOAD_CHUNK_SIZE
-                    uploaded = min(uploaded, file_size)  # Don't exceed file size
+                    uploaded = min(status.resumable_progress, file_size)  # Don't exceed file size
                     
                     # Call progress callback with bytes
                     if progress_callback:
@@ -405,6 +569,76 @@ class GoogleDriveClient:
 
         return folder.get('id')
 
+    def create_folders_batch(self, folders: List[Tuple[str, str]]
+                             ) -> Tuple[List[Optional[str]], Dict[int, Exception]]:
+        """
+        Crée plusieurs dossiers en regroupant les requêtes dans des batchs HTTP
+
+        Args:
+            folders: Liste de tuples (nom du dossier, ID du dossier parent)
+
+        Returns:
+            Tuple (IDs créés dans le même ordre, None si la création a échoué;
+            erreur de chaque création échouée, par index dans folders)
+        """
+        folder_ids: List[Optional[str]] = [None] * len(folders)
+        errors: Dict[int, Exception] = {}
+
+        def on_response(request_id, response, exception):
+            if exception is not None:
+                errors[int(request_id)] = exception
+                return
+            folder_ids[int(request_id)] = response.get('id')
+
+        for start in range(0, len(folders), DRIVE_BATCH_MAX_REQUESTS):
+            batch = self.service.new_batch_http_request(callback=on_response)
+            for index in range(start, min(start + DRIVE_BATCH_MAX_REQUESTS, len(folders))):
+                folder_name, parent_id = folders[index]
+                batch.add(self.service.files().create(
+                    body={
+                        'name': folder_name,
+                        'mimeType': 'application/vnd.google-apps.folder',
+                        'parents': [parent_id]
+                    },
+                    fields='id',
+                    supportsAllDrives=True
+                ), request_id=str(index))
+            batch.execute()
+
+        return folder_ids, errors
+
+    def list_child_folders(self, parent_id: str) -> List[Dict[str, Any]]:
+        """
+        Liste tous les sous-dossiers d'un dossier parent
+
+        Args:
+            parent_id: ID du dossier parent
+
+        Returns:
+            Liste des dossiers (id, name)
+        """
+        query = (
+            f"'{parent_id}' in parents and "
+            f"mimeType = 'application/vnd.google-apps.folder' and "
+            f"trashed = false"
+        )
+        folders = []
+        page_token = None
+        while True:
+            results = self.service.files().list(
+                q=query,
+                spaces='drive',
+                pageSize=1000,
+                pageToken=page_token,
+                fields='nextPageToken, files(id, name)',
+                supportsAllDrives=True,
+                includeItemsFromAllDrives=True
+            ).execute()
+            folders.extend(results.get('files', []))
+            page_token = results.get('nextPageToken')
+            if not page_token:
+                return folders
+
     def rename_item(self, file_id: str, new_name: str) -> Dict[str, Any]:
         """
         Renomme un fichier ou dossier
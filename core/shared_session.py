@@ -0,0 +1,60 @@
+"""
+Session HTTP persistante partagée pour les requêtes directes vers Google Drive
+"""
+
+import threading
+from typing import Optional
+
+from google.auth.transport.requests import AuthorizedSession
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config.settings import HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE
+
+_session: Optional[AuthorizedSession] = None
+_session_lock = threading.Lock()
+
+
+def get_shared_session(credentials) -> AuthorizedSession:
+    """
+    Retourne la session authentifiée partagée par tout le processus
+
+    La session garde ses connexions TLS ouvertes (keep-alive) et peut être
+    utilisée depuis plusieurs threads: le pool de connexions est dimensionné
+    au-delà du nombre de workers de transfert.
+
+    Args:
+        credentials: Credentials Google utilisés à la création de la session
+
+    Returns:
+        Session requests authentifiée
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = AuthorizedSession(credentials)
+            adapter = HTTPAdapter(
+                pool_connections=HTTP_POOL_CONNECTIONS,
+                pool_maxsize=HTTP_POOL_MAXSIZE,
+                max_retries=Retry(
+                    total=5,
+                    backoff_factor=0.3,
+                    status_forcelist=[429, 500, 502, 503, 504]
+                )
+            )
+            session.mount("https://", adapter)
+            _session = session
+        return _session
+
+
+def reset_shared_session() -> None:
+    """
+    Oublie la session partagée (déconnexion, changement de compte)
+
+    Le prochain appel à get_shared_session crée une session avec les
+    credentials qui lui sont passés. L'ancienne session n'est pas fermée:
+    un téléchargement en cours la garde jusqu'à sa fin.
+    """
+    global _session
+    with _session_lock:
+        _session = None
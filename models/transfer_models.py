@@ -3,9 +3,10 @@ Modèles de données pour la gestion des transferts
 """
 
 import os
+import time
 from datetime import datetime
 from enum import Enum
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from PyQt5.QtCore import QObject, pyqtSignal, QTimer
 from PyQt5.QtGui import QStandardItemModel, QStandardItem
 from PyQt5.QtCore import Qt
@@ -284,7 +285,10 @@ class TransferManager(QObject):
                                  bytes_transferred: int = 0, speed: float = 0) -> None:
         """
         Met à jour le progrès d'un transfert
-        
+
+        Les valeurs sont toujours enregistrées, mais le signal transfer_updated
+        n'est émis qu'une fois par intervalle de throttling (sauf à 100 %).
+
         Args:
             transfer_id: ID du transfert
             progress: Progrès en pourcentage (0-100)
@@ -293,19 +297,23 @@ class TransferManager(QObject):
         """
         if transfer_id in self.transfers:
             transfer = self.transfers[transfer_id]
-            
-            # Pour les dossiers, calculer le progrès global automatiquement
-            if transfer.is_folder_transfer and transfer.child_files:
-                transfer.progress = transfer.get_overall_progress()
-            else:
+            is_folder = transfer.is_folder_transfer and transfer.child_files
+
+            if not is_folder:
                 transfer.progress = progress
-                
             transfer.bytes_transferred = bytes_transferred
             transfer.speed = speed
 
             if transfer.status == TransferStatus.PENDING:
                 self.update_transfer_status(transfer_id, TransferStatus.IN_PROGRESS)
 
+            if progress < 100 and not self._throttle_interval_elapsed(transfer_id):
+                return
+
+            # Pour les dossiers, calculer le progrès global (parcours de tous les
+            # fichiers) uniquement lorsque le signal est réellement émis
+            if is_folder:
+                transfer.progress = transfer.get_overall_progress()
             self.transfer_updated.emit(transfer_id)
 
     def update_transfer_status(self, transfer_id: str, status: TransferStatus,
@@ -443,64 +451,110 @@ class TransferManager(QObject):
         """
         if transfer_id in self.transfers:
             transfer = self.transfers[transfer_id]
-            transfer.update_child_file_status(file_path, status, progress, error_message)
+            self._apply_file_status(transfer, file_path, status, progress, error_message, speed)
+            self._refresh_folder_status(transfer, status)
+
+    def update_file_statuses_bulk(self, updates: List[Tuple[str, str, TransferStatus, int, str, float]]) -> None:
+        """
+        Applique plusieurs mises à jour de fichiers en une seule passe
+
+        Le statut global de chaque dossier n'est recalculé, et son signal émis,
+        qu'une fois par transfert concerné au lieu d'une fois par fichier.
+
+        Args:
+            updates: Liste de tuples (transfer_id, file_path, status, progress, error_message, speed)
+        """
+        # transfer_id -> statut le plus significatif du lot (IN_PROGRESS prioritaire)
+        touched: Dict[str, TransferStatus] = {}
+        for transfer_id, file_path, status, progress, error_message, speed in updates:
+            transfer = self.transfers.get(transfer_id)
+            if transfer is None:
+                continue
+            self._apply_file_status(transfer, file_path, status, progress, error_message, speed)
+            if touched.get(transfer_id) != TransferStatus.IN_PROGRESS:
+                touched[transfer_id] = status
+
+        for transfer_id, status in touched.items():
+            self._refresh_folder_status(self.transfers[transfer_id], status)
+
+    def _apply_file_status(self, transfer: TransferItem, file_path: str, status: TransferStatus,
+                           progress: int, error_message: str, speed: float) -> None:
+        """Met à jour un fichier enfant (statut, progrès, vitesse)"""
+        transfer.update_child_file_status(file_path, status, progress, error_message)
+
+        # Mettre à jour la vitesse du fichier
+        if file_path in transfer.child_files:
+            transfer.child_files[file_path].speed = speed
+
+    def _refresh_folder_status(self, transfer: TransferItem, status: TransferStatus) -> None:
+        """
+        Recalcule le statut global d'un dossier et notifie l'interface
+
+        Args:
+            transfer: Transfert mis à jour
+            status: Statut du (dernier) fichier mis à jour
+        """
+        transfer_id = transfer.transfer_id
+
+        # CHANGEMENT: Approche simplifiée pour le statut du dossier
+        if transfer.is_folder_transfer:
+            # Dès qu'un fichier commence, le dossier passe en cours
+            if status == TransferStatus.IN_PROGRESS and transfer.status == TransferStatus.PENDING:
+                transfer.status = TransferStatus.IN_PROGRESS
+                transfer.start_time = datetime.now()
+                print(f"DEBUG: Dossier {transfer.file_name} passé en IN_PROGRESS")
             
-            # Mettre à jour la vitesse du fichier
-            if file_path in transfer.child_files:
-                transfer.child_files[file_path].speed = speed
+            # Mettre à jour le progrès global du transfert
+            overall_progress = transfer.get_overall_progress()
+            transfer.progress = overall_progress
             
-            # CHANGEMENT: Approche simplifiée pour le statut du dossier
-            if transfer.is_folder_transfer:
-                # Dès qu'un fichier commence, le dossier passe en cours
-                if status == TransferStatus.IN_PROGRESS and transfer.status == TransferStatus.PENDING:
-                    transfer.status = TransferStatus.IN_PROGRESS
-                    transfer.start_time = datetime.now()
-                    print(f"DEBUG: Dossier {transfer.file_name} passé en IN_PROGRESS")
-                
-                # Mettre à jour le progrès global du transfert
-                overall_progress = transfer.get_overall_progress()
-                transfer.progress = overall_progress
-                
-                # Déterminer le statut global basé sur les fichiers
-                failed_count = transfer.get_failed_files_count()
-                completed_count = transfer.get_completed_files_count()
-                in_progress_count = sum(1 for f in transfer.child_files.values() if f.status == TransferStatus.IN_PROGRESS)
-                total_count = len(transfer.child_files)
-                
-                # Vérifier si tous les fichiers sont traités
-                if completed_count + failed_count == total_count and total_count > 0:
-                    # Tous les fichiers sont traités
-                    if failed_count == 0:
-                        # Tous réussis
-                        transfer.status = TransferStatus.COMPLETED
-                    elif completed_count > 0:
-                        # Certains réussis, certains échoués - garder en erreur mais avec infos détaillées
-                        transfer.status = TransferStatus.ERROR
-                        transfer.error_message = f"{failed_count} fichier(s) échoué(s) sur {total_count}"
-                    else:
-                        # Tous échoués
-                        transfer.status = TransferStatus.ERROR
-                        transfer.error_message = "Tous les fichiers ont échoué"
-                    
-                    transfer.end_time = datetime.now()
-                    print(f"DEBUG: Dossier {transfer.file_name} terminé avec statut {transfer.status.value}")
+            # Déterminer le statut global basé sur les fichiers
+            failed_count = transfer.get_failed_files_count()
+            completed_count = transfer.get_completed_files_count()
+            in_progress_count = sum(1 for f in transfer.child_files.values() if f.status == TransferStatus.IN_PROGRESS)
+            total_count = len(transfer.child_files)
             
-            # Toujours émettre immédiatement pour les changements de statut importants
-            if status == TransferStatus.IN_PROGRESS or transfer.status in [TransferStatus.COMPLETED, TransferStatus.ERROR]:
-                self.transfer_updated.emit(transfer_id)
-            else:
-                self._emit_transfer_updated_throttled(transfer_id)
-    
+            # Vérifier si tous les fichiers sont traités
+            if completed_count + failed_count == total_count and total_count > 0:
+                # Tous les fichiers sont traités
+                if failed_count == 0:
+                    # Tous réussis
+                    transfer.status = TransferStatus.COMPLETED
+                elif completed_count > 0:
+                    # Certains réussis, certains échoués - garder en erreur mais avec infos détaillées
+                    transfer.status = TransferStatus.ERROR
+                    transfer.error_message = f"{failed_count} fichier(s) échoué(s) sur {total_count}"
+                else:
+                    # Tous échoués
+                    transfer.status = TransferStatus.ERROR
+                    transfer.error_message = "Tous les fichiers ont échoué"
+                
+                transfer.end_time = datetime.now()
+                print(f"DEBUG: Dossier {transfer.file_name} terminé avec statut {transfer.status.value}")
+        
+        # Toujours émettre immédiatement pour les changements de statut importants
+        if status == TransferStatus.IN_PROGRESS or transfer.status in [TransferStatus.COMPLETED, TransferStatus.ERROR]:
+            self.transfer_updated.emit(transfer_id)
+        else:
+            self._emit_transfer_updated_throttled(transfer_id)
+
     def _emit_transfer_updated_throttled(self, transfer_id: str) -> None:
         """Émet le signal transfer_updated avec throttling pour éviter la surcharge UI"""
-        import time
+        if self._throttle_interval_elapsed(transfer_id):
+            self.transfer_updated.emit(transfer_id)
+
+    def _throttle_interval_elapsed(self, transfer_id: str) -> bool:
+        """
+        Indique si assez de temps s'est écoulé depuis la dernière émission pour ce transfert
+
+        Enregistre l'instant courant comme dernière émission si c'est le cas.
+        """
         current_time = time.time()
         last_update = self._last_update_time.get(transfer_id, 0)
-        
-        # Émettre seulement si assez de temps s'est écoulé
         if current_time - last_update >= self._update_interval:
             self._last_update_time[transfer_id] = current_time
-            self.transfer_updated.emit(transfer_id)
+            return True
+        return False
     
     def get_failed_files_for_retry(self, transfer_id: str) -> Dict[str, FileTransferItem]:
         """
@@ -3,6 +3,7 @@ Unified Upload Manager - Coordinates the queue-based upload system
 """
 
 import os
+import stat
 from typing import List, Optional, Dict, Any
 from PyQt5.QtCore import QObject, pyqtSignal, QTimer
 
@@ -167,11 +168,16 @@ class UnifiedUploadManager(QObject):
         files_to_add = []
         
         for file_path in file_paths:
-            if not os.path.isfile(file_path):
+            # Single stat call for both the file type and its size
+            try:
+                file_stat = os.stat(file_path)
+            except OSError:
+                continue
+            if not stat.S_ISREG(file_stat.st_mode):
                 continue
             
             try:
-                file_size = os.path.getsize(file_path)
+                file_size = file_stat.st_size
                 file_name = os.path.basename(file_path)
                 
                 queued_file = QueuedFile(
@@ -72,10 +72,10 @@ class QueuedFile:
         """Initialize computed fields"""
         if not self.file_name:
             self.file_name = os.path.basename(self.file_path)
-        if self.file_size == 0 and os.path.exists(self.file_path):
+        if self.file_size == 0:
             try:
                 self.file_size = os.path.getsize(self.file_path)
-            except:
+            except OSError:
                 self.file_size = 0
     
     @property
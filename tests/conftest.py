@@ -0,0 +1,28 @@
+"""
+Configuration pytest: les tests importent les packages depuis la racine du projet
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _clear_google_drive_utils_state() -> None:
+    """Vide les caches d'existence et de listing et les verrous de listing en cours"""
+    # Module importé seulement par les tests qui en dépendent (PyQt5, googleapiclient)
+    google_drive_utils = sys.modules.get("utils.google_drive_utils")
+    if google_drive_utils is None:
+        return
+    google_drive_utils._exists_cache.clear()
+    google_drive_utils._folder_listing_cache.clear()
+    google_drive_utils._folder_fetch_locks.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_drive_caches():
+    _clear_google_drive_utils_state()
+    yield
+    _clear_google_drive_utils_state()
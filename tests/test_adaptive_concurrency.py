@@ -0,0 +1,81 @@
+"""
+Tests de AdaptiveConcurrency
+"""
+
+import pytest
+
+pytest.importorskip("PyQt5")
+pytest.importorskip("googleapiclient")
+
+from threads import transfer_threads
+from threads.transfer_threads import AdaptiveConcurrency
+
+MB = 1024 * 1024
+
+
+class FakeClock:
+    """Horloge monotone avancée à la main"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(transfer_threads.time, "monotonic", fake)
+    return fake
+
+
+def run_period(controller, clock, sizes, duration=5.0):
+    """Termine les fichiers d'une période puis la clôt"""
+    for size in sizes:
+        controller.record(size)
+    clock.now += duration
+    controller.record(0)
+
+
+def test_grows_above_initial_while_throughput_improves(clock):
+    controller = AdaptiveConcurrency(initial=4, minimum=2, maximum=16)
+
+    for period in range(1, 6):
+        run_period(controller, clock, [10 * MB * period])
+
+    assert controller.current > 4
+
+
+def test_periods_without_uploaded_files_do_not_shrink(clock):
+    controller = AdaptiveConcurrency(initial=4, minimum=2, maximum=16)
+    run_period(controller, clock, [10 * MB])
+
+    # Uniquement des fichiers déjà présents sur Drive (taille 0)
+    run_period(controller, clock, [0] * 50)
+    run_period(controller, clock, [0] * 50)
+
+    assert controller.current == 4
+
+
+def test_single_slow_period_is_smoothed(clock):
+    controller = AdaptiveConcurrency(initial=4, minimum=2, maximum=16)
+    run_period(controller, clock, [10 * MB])
+
+    # Débit mesuré 3% plus bas: le débit lissé reste dans la marge de ±5%
+    run_period(controller, clock, [int(9.7 * MB)])
+
+    assert controller.current == 4
+
+
+def test_only_own_backoffs_shrink_the_window(clock):
+    controller = AdaptiveConcurrency(initial=4, minimum=2, maximum=16)
+    other = AdaptiveConcurrency(initial=4, minimum=2, maximum=16)
+
+    other.record_backoff()
+    run_period(controller, clock, [10 * MB])
+    assert controller.current == 4
+
+    controller.record_backoff()
+    run_period(controller, clock, [10 * MB])
+    assert controller.current == 3
@@ -0,0 +1,84 @@
+"""
+Tests de GoogleDriveClient.download_file_parallel
+"""
+
+from unittest import mock
+
+import pytest
+
+pytest.importorskip("PyQt5")
+pytest.importorskip("googleapiclient")
+
+from core import google_drive_client
+from core.google_drive_client import GoogleDriveClient
+
+PART_SIZE = 8
+CONTENT = bytes(range(20))  # 3 parties: 0-7, 8-15, 16-19
+
+
+class FakeResponse:
+    """Réponse HTTP minimale, utilisable comme context manager"""
+
+    def __init__(self, status_code, body):
+        self.status_code = status_code
+        self.body = body
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self.body), 3):
+            yield self.body[start:start + 3]
+
+
+class FakeSession:
+    """Session qui sert CONTENT; respond() permet de dégrader les réponses"""
+
+    def __init__(self, respond=None):
+        self.respond = respond or (lambda start, end: FakeResponse(206, CONTENT[start:end + 1]))
+
+    def get(self, url, params, headers, stream, timeout):
+        start, end = map(int, headers['Range'][len("bytes="):].split('-'))
+        return self.respond(start, end)
+
+
+def make_client(monkeypatch, session):
+    monkeypatch.setattr(google_drive_client, "DOWNLOAD_PART_SIZE", PART_SIZE)
+    monkeypatch.setattr(google_drive_client, "get_shared_session", lambda credentials: session)
+    client = GoogleDriveClient.__new__(GoogleDriveClient)
+    client._credentials = None
+    client.service = mock.MagicMock()
+    client.service.files.return_value.get.return_value.execute.return_value = {'size': str(len(CONTENT))}
+    return client
+
+
+def test_parts_written_at_their_offsets(tmp_path, monkeypatch):
+    client = make_client(monkeypatch, FakeSession())
+    progress = []
+
+    client.download_file_parallel("file-id", "data.bin", str(tmp_path), progress.append)
+
+    assert (tmp_path / "data.bin").read_bytes() == CONTENT
+    assert max(progress) == 100
+
+
+def test_full_body_200_is_rejected(tmp_path, monkeypatch):
+    session = FakeSession(lambda start, end: FakeResponse(200, CONTENT))
+    client = make_client(monkeypatch, session)
+
+    with pytest.raises(IOError):
+        client.download_file_parallel("file-id", "data.bin", str(tmp_path))
+
+
+def test_short_part_is_rejected(tmp_path, monkeypatch):
+    session = FakeSession(lambda start, end: FakeResponse(206, CONTENT[start:end]))
+    client = make_client(monkeypatch, session)
+
+    with pytest.raises(IOError):
+        client.download_file_parallel("file-id", "data.bin", str(tmp_path))
@@ -0,0 +1,48 @@
+"""
+Tests de FolderMapping
+"""
+
+import threading
+
+import pytest
+
+pytest.importorskip("PyQt5")
+pytest.importorskip("googleapiclient")
+
+from threads.transfer_threads import FolderMapping
+
+
+def get_in_thread(mapping, rel_path):
+    """Lance mapping.get dans un thread; retourne (thread, résultats)"""
+    results = []
+    thread = threading.Thread(target=lambda: results.append(mapping.get(rel_path, "default")), daemon=True)
+    thread.start()
+    return thread, results
+
+
+def test_root_is_available_immediately():
+    assert FolderMapping("root-id").get("") == "root-id"
+
+
+def test_get_waits_for_set():
+    mapping = FolderMapping("root-id")
+    thread, results = get_in_thread(mapping, "sub")
+
+    thread.join(timeout=0.2)
+    assert thread.is_alive()
+
+    mapping.set("sub", "sub-id")
+    thread.join(timeout=5)
+    assert results == ["sub-id"]
+
+
+def test_get_returns_default_once_closed():
+    mapping = FolderMapping("root-id")
+    thread, results = get_in_thread(mapping, "never-created")
+
+    thread.join(timeout=0.2)
+    assert thread.is_alive()
+
+    mapping.close()
+    thread.join(timeout=5)
+    assert results == ["default"]
@@ -0,0 +1,36 @@
+"""
+Tests du parcours local de FolderScanner
+"""
+
+import os
+
+import pytest
+
+pytest.importorskip("PyQt5")
+pytest.importorskip("googleapiclient")
+
+# Même ordre d'import que l'application (main.py): views avant threads.folder_scanner
+import views  # noqa: F401
+from threads.folder_scanner import FolderScanner
+
+
+def test_scan_order_matches_os_walk(tmp_path):
+    for rel_dir in ("b", "a", "a/y", "a/x", "c", "c/z"):
+        (tmp_path / rel_dir).mkdir()
+    for rel_file in ("root.txt", "b/1.txt", "a/2.txt", "a/y/3.txt", "a/x/4.txt", "c/z/5.txt", "c/skip.tif"):
+        (tmp_path / rel_file).write_bytes(b"data")
+
+    scanner = FolderScanner(upload_queue=None, drive_client=None)
+    folder_structure, all_files = scanner._scan_local_structure(str(tmp_path))
+
+    expected_files = []
+    expected_structure = {}
+    for root, dirs, files in os.walk(tmp_path):
+        rel_path = os.path.relpath(root, tmp_path)
+        rel_path = '' if rel_path == '.' else rel_path
+        if dirs:
+            expected_structure[rel_path] = dirs
+        expected_files.extend(os.path.join(root, name) for name in files if not name.endswith('.tif'))
+
+    assert folder_structure == expected_structure
+    assert [info['file_path'] for info in all_files] == expected_files
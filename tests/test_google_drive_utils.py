@@ -0,0 +1,94 @@
+"""
+Tests des utilitaires de utils/google_drive_utils
+"""
+
+from unittest import mock
+
+import pytest
+
+pytest.importorskip("PyQt5")
+pytest.importorskip("googleapiclient")
+
+from utils import google_drive_utils
+from utils.google_drive_utils import already_exists_in_folder
+
+
+def test_folder_fetch_lock_dropped_after_listing(monkeypatch):
+    listed = []
+
+    def list_names(drive_client, parent_id):
+        listed.append(parent_id)
+        if parent_id == "broken":
+            raise IOError("listing impossible")
+        return {"a.txt"}
+
+    monkeypatch.setattr(google_drive_utils, "list_file_names_in_folder", list_names)
+    client = mock.MagicMock()
+
+    assert already_exists_in_folder(client, "folder", "a.txt")
+    assert already_exists_in_folder(client, "folder", "b.txt") is False
+    google_drive_utils._get_folder_listing(client, "broken")
+
+    # Un seul listing par dossier, et aucun verrou conservé une fois listé
+    assert listed == ["folder", "broken"]
+    assert google_drive_utils._folder_fetch_locks == {}
+
+
+def test_tracker_claim_is_owned_by_its_worker():
+    tracker = google_drive_utils.DuplicateTracker()
+
+    assert tracker.claim_file("folder", "a.txt", "worker-1")
+    assert not tracker.claim_file("folder", "a.txt", "worker-2")
+
+    # Un autre worker ne peut ni libérer ni marquer le claim
+    tracker.release_file("folder", "a.txt", "worker-2")
+    tracker.mark_uploaded("folder", "a.txt", "file-2", "worker-2")
+    assert tracker.is_being_uploaded("folder", "a.txt")
+    assert not tracker.is_uploaded_in_session("folder", "a.txt")
+
+    tracker.mark_uploaded("folder", "a.txt", "file-1", "worker-1")
+    assert tracker.is_uploaded_in_session("folder", "a.txt")
+    assert not tracker.claim_file("folder", "a.txt", "worker-2")
+
+    # Un fichier uploadé n'est plus libérable
+    tracker.release_file("folder", "a.txt", "worker-1")
+    assert tracker.is_uploaded_in_session("folder", "a.txt")
+
+
+def test_tracker_release_allows_a_new_claim():
+    tracker = google_drive_utils.DuplicateTracker()
+    tracker.claim_file("folder", "a.txt", "worker-1")
+
+    tracker.release_file("folder", "a.txt", "worker-1")
+
+    assert not tracker.is_being_uploaded("folder", "a.txt")
+    assert tracker.claim_file("folder", "a.txt", "worker-2")
+
+
+def test_tracker_stats_count_each_status():
+    tracker = google_drive_utils.DuplicateTracker()
+    for index in range(40):
+        tracker.claim_file(f"folder-{index % 3}", f"file-{index}.txt", "worker")
+    for index in range(0, 40, 4):
+        tracker.mark_uploaded(f"folder-{index % 3}", f"file-{index}.txt", f"id-{index}", "worker")
+
+    assert tracker.get_stats() == {'uploaded_files': 10, 'uploading_files': 30}
+
+    tracker.clear_all()
+    assert tracker.get_stats() == {'uploaded_files': 0, 'uploading_files': 0}
+
+
+def test_set_drive_concurrency_replaces_the_limit(monkeypatch):
+    monkeypatch.setattr(google_drive_utils, "_drive_call_slots", google_drive_utils._drive_call_slots)
+
+    google_drive_utils.set_drive_concurrency(2)
+    slots = google_drive_utils._drive_call_slots
+    assert slots.acquire(blocking=False)
+    assert slots.acquire(blocking=False)
+    assert not slots.acquire(blocking=False)
+    slots.release()
+    slots.release()
+
+    google_drive_utils.set_drive_concurrency(0)
+    assert google_drive_utils._drive_call_slots.acquire(blocking=False)
+    assert not google_drive_utils._drive_call_slots.acquire(blocking=False)
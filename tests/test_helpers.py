@@ -0,0 +1,31 @@
+"""
+Tests des fonctions utilitaires de utils/helpers
+"""
+
+import pytest
+
+from utils.helpers import format_file_size
+
+
+@pytest.mark.parametrize("size, expected", [
+    (0, "0 B"),
+    (0.0, "0 B"),
+    ('0', "0 B"),
+    (1, "1.00 B"),
+    (1023, "1023.00 B"),
+    (1023.999, "1024.00 B"),
+    (1024, "1.00 KB"),
+    (1024.5, "1.00 KB"),
+    ('1536', "1.50 KB"),
+    (1024 ** 2 - 1, "1024.00 KB"),
+    (1024 ** 2, "1.00 MB"),
+    (2.5 * 1024 ** 3, "2.50 GB"),
+    ('5497558138880', "5.00 TB"),
+    (3 * 1024 ** 5, "3072.00 TB"),
+    (-2048, "-2048.00 B"),
+    (float('inf'), "inf TB"),
+    (float('-inf'), "-inf B"),
+    (float('nan'), "nan B"),
+])
+def test_format_file_size(size, expected):
+    assert format_file_size(size) == expected
@@ -0,0 +1,64 @@
+"""
+Tests de SafeGoogleDriveUploader.safe_upload_file
+"""
+
+from unittest import mock
+
+import pytest
+
+pytest.importorskip("PyQt5")
+pytest.importorskip("googleapiclient")
+
+from threads import transfer_threads
+from threads.transfer_threads import SafeGoogleDriveUploader
+from utils import google_drive_utils
+
+PARENT_ID = "parent-folder"
+FILE_NAME = "rapport.pdf"
+
+
+class FakeDriveClient:
+    """Client Drive minimal: l'upload est validé côté serveur puis lève un timeout"""
+
+    def __init__(self):
+        self.server_files = set()
+        self.upload_calls = 0
+        self.service = mock.MagicMock()
+        self.service.files.return_value.list.side_effect = self._list
+
+    def _list(self, q, **kwargs):
+        request = mock.MagicMock()
+        found = [{'id': 'committed-id'}] if f"name = '{FILE_NAME}'" in q and FILE_NAME in self.server_files else []
+        request.execute.return_value = {'files': found}
+        return request
+
+    def upload_file(self, file_path, parent_id, *args):
+        self.upload_calls += 1
+        self.server_files.add(FILE_NAME)
+        raise TimeoutError("timeout while reading the response")
+
+    def list_files(self, parent_id):
+        return [{'name': name} for name in self.server_files]
+
+    def close(self):
+        pass
+
+
+def test_upload_committed_before_error_is_not_uploaded_again(tmp_path, monkeypatch):
+    monkeypatch.setattr(transfer_threads.time, "sleep", lambda seconds: None)
+    file_path = tmp_path / FILE_NAME
+    file_path.write_bytes(b"contenu")
+
+    # État vu par la vérification faite avant l'upload: le fichier n'existe pas
+    google_drive_utils._store_listing(PARENT_ID, set())
+    google_drive_utils._set_cached_exists((PARENT_ID, FILE_NAME), False)
+
+    client = FakeDriveClient()
+    with pytest.raises(Exception):
+        SafeGoogleDriveUploader.safe_upload_file(
+            str(file_path), PARENT_ID, drive_client=client, max_retries=3
+        )
+
+    # La re-vérification a vu le fichier validé par le serveur: pas de second upload
+    assert client.upload_calls == 1
+    assert google_drive_utils.already_exists_in_folder(client, PARENT_ID, FILE_NAME)
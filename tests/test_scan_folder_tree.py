@@ -0,0 +1,27 @@
+"""
+Tests de SafeFolderUploadThread.scan_folder_tree
+"""
+
+import os
+
+import pytest
+
+pytest.importorskip("PyQt5")
+pytest.importorskip("googleapiclient")
+
+from threads.transfer_threads import SafeFolderUploadThread
+
+
+def test_files_follow_folder_creation_order(tmp_path):
+    for rel_dir in ("a", "a/b", "a/b/c", "b"):
+        (tmp_path / rel_dir).mkdir(parents=True, exist_ok=True)
+    for rel_file in ("a/b/c/deep.txt", "a/b/mid.txt", "b/top.txt", "a/top.txt", "root.txt"):
+        (tmp_path / rel_file).write_bytes(b"data")
+
+    thread = SafeFolderUploadThread(drive_client=None, folder_path=str(tmp_path))
+    _, _, _, files = thread.scan_folder_tree(str(tmp_path))
+
+    # Un dossier créé au niveau N passe avant tout dossier plus profond
+    assert [info.relative_dir for info in files] == [
+        '', 'a', 'b', os.path.join('a', 'b'), os.path.join('a', 'b', 'c')
+    ]
@@ -1,23 +1,85 @@
 """
 Threads pour charger les fichiers en arrière-plan
+
+Les chargements sont des QRunnable exécutés dans un pool partagé: changer de
+dossier annule le chargement précédent (annulation coopérative) au lieu de
+tuer son thread, et plusieurs listings peuvent être lus en parallèle.
 """
 
 import os
-from typing import List, Dict, Any, Tuple
-from PyQt5.QtCore import QThread, pyqtSignal
+import threading
+from typing import List, Dict, Any, Tuple, Optional
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
 
+from config.settings import FILE_LOAD_MAX_THREADS, FILE_LOAD_CANCEL_CHECK_INTERVAL
 from core.google_drive_client import GoogleDriveClient
 
+_load_pool: Optional[QThreadPool] = None
+
+
+def _get_load_pool() -> QThreadPool:
+    """
+    Retourne le pool de threads des chargements de listings (créé au premier appel)
+
+    Returns:
+        Pool partagé par tous les chargements locaux et Google Drive
+    """
+    global _load_pool
+    if _load_pool is None:
+        _load_pool = QThreadPool()
+        _load_pool.setMaxThreadCount(FILE_LOAD_MAX_THREADS)
+    return _load_pool
+
+
+class FileLoadSignals(QObject):
+    """Signaux d'un chargement (un QRunnable ne peut pas émettre lui-même)"""
+
+    files_loaded = pyqtSignal(str, list)  # path ou folder_id, file_list
+    error_occurred = pyqtSignal(str, str)  # path ou folder_id, error_message
+
+
+class _CancellableLoad(QRunnable):
+    """Base des chargements: signaux, démarrage dans le pool et annulation"""
+
+    def __init__(self):
+        super().__init__()
+        self.signals = FileLoadSignals()
+        self._cancel = threading.Event()
 
-class LocalFileLoadThread(QThread):
-    """Thread pour charger les fichiers locaux en arrière-plan"""
+    @property
+    def files_loaded(self):
+        """Signal émis avec la liste des fichiers chargés"""
+        return self.signals.files_loaded
 
-    files_loaded = pyqtSignal(str, list)  # path, file_list
-    error_occurred = pyqtSignal(str, str)  # path, error_message
+    @property
+    def error_occurred(self):
+        """Signal émis en cas d'erreur de chargement"""
+        return self.signals.error_occurred
+
+    def start(self) -> None:
+        """Soumet le chargement au pool partagé"""
+        _get_load_pool().start(self)
+
+    def cancel(self) -> None:
+        """Demande l'arrêt du chargement, vérifié entre les étapes de lecture"""
+        self._cancel.set()
+
+    def run(self) -> None:
+        """Exécute le chargement s'il n'a pas été annulé entre-temps"""
+        if not self._cancel.is_set():
+            self.load()
+
+    def load(self) -> None:
+        """Charge les fichiers (implémenté par les sous-classes)"""
+        raise NotImplementedError
+
+
+class LocalFileLoadThread(_CancellableLoad):
+    """Chargement des fichiers locaux en arrière-plan"""
 
     def __init__(self, path: str):
         """
-        Initialise le thread de chargement local
+        Initialise le chargement local
 
         Args:
             path: Chemin du dossier à charger
@@ -25,7 +87,7 @@ class LocalFileLoadThread(QThread):
         super().__init__()
         self.path = path
 
-    def run(self) -> None:
+    def load(self) -> None:
         """Charge les fichiers locaux"""
         try:
             file_list = []
@@ -40,50 +102,53 @@ class LocalFileLoadThread(QThread):
                     'is_dir': True
                 })
 
-            # Lister les fichiers et dossiers
+            # Lister les fichiers et dossiers: os.scandir fournit le type de chaque
+            # entrée avec la lecture du dossier, un seul stat par entrée suffit
             items = []
-            for item in os.listdir(self.path):
-                item_path = os.path.join(self.path, item)
-                try:
-                    stats = os.stat(item_path)
-                    is_dir = os.path.isdir(item_path)
-
-                    file_info = {
-                        'name': item,
-                        'type': 'folder' if is_dir else 'file',
-                        'size': '' if is_dir else stats.st_size,
-                        'modified': stats.st_mtime,
-                        'is_dir': is_dir,
-                        'path': item_path
-                    }
-                    items.append(file_info)
-                except Exception:
-                    # Ignorer les fichiers inaccessibles
-                    pass
+            cancel_requested = self._cancel.is_set
+            with os.scandir(self.path) as entries:
+                for count, entry in enumerate(entries):
+                    if count % FILE_LOAD_CANCEL_CHECK_INTERVAL == 0 and cancel_requested():
+                        return
+                    try:
+                        stats = entry.stat()
+                        is_dir = entry.is_dir()
+
+                        file_info = {
+                            'name': entry.name,
+                            'type': 'folder' if is_dir else 'file',
+                            'size': '' if is_dir else stats.st_size,
+                            'modified': stats.st_mtime,
+                            'is_dir': is_dir,
+                            'path': entry.path
+                        }
+                        items.append(file_info)
+                    except Exception:
+                        # Ignorer les fichiers inaccessibles
+                        pass
 
             # Trier: dossiers d'abord, puis par nom
             items.sort(key=lambda x: (not x['is_dir'], x['name'].lower()))
             file_list.extend(items)
 
-            self.files_loaded.emit(self.path, file_list)
+            if not self._cancel.is_set():
+                self.files_loaded.emit(self.path, file_list)
 
         except Exception as e:
-            self.error_occurred.emit(self.path, str(e))
+            if not self._cancel.is_set():
+                self.error_occurred.emit(self.path, str(e))
 
 
-class DriveFileLoadThread(QThread):
-    """Thread pour charger les fichiers Google Drive en arrière-plan"""
-
-    files_loaded = pyqtSignal(str, list)  # folder_id, file_list
-    error_occurred = pyqtSignal(str, str)  # folder_id, error_message
+class DriveFileLoadThread(_CancellableLoad):
+    """Chargement des fichiers Google Drive en arrière-plan"""
 
     def __init__(self, drive_client: GoogleDriveClient, folder_id: str,
                  current_path_history: List[Tuple[str, str]]):
         """
-        Initialise le thread de chargement Google Drive
+        Initialise le chargement Google Drive
 
         Args:
-            drive_client: Client Google Drive
+            drive_client: Client Google Drive (ses credentials servent au client du chargement)
             folder_id: ID du dossier à charger
             current_path_history: Historique du chemin actuel
         """
@@ -92,7 +157,7 @@ class DriveFileLoadThread(QThread):
         self.folder_id = folder_id
         self.current_path_history = current_path_history
 
-    def run(self) -> None:
+    def load(self) -> None:
         """Charge les fichiers Google Drive"""
         try:
             file_list = []
@@ -111,7 +176,15 @@ class DriveFileLoadThread(QThread):
                 })
 
             # Obtenir les fichiers du dossier
-            files = self.drive_client.list_files(self.folder_id)
+            # Client propre à ce chargement: un chargement annulé peut encore avoir
+            # sa requête en vol quand le suivant démarre, et httplib2 n'est pas thread-safe
+            client = GoogleDriveClient(credentials=self.drive_client.credentials)
+            try:
+                files = client.list_files(self.folder_id)
+            finally:
+                client.close()
+            if self._cancel.is_set():
+                return
 
             # Traiter et trier les fichiers
             folders = []
@@ -139,7 +212,9 @@ class DriveFileLoadThread(QThread):
 
             file_list.extend(folders + other_files)
 
-            self.files_loaded.emit(self.folder_id, file_list)
+            if not self._cancel.is_set():
+                self.files_loaded.emit(self.folder_id, file_list)
 
         except Exception as e:
-            self.error_occurred.emit(self.folder_id, str(e))
+            if not self._cancel.is_set():
+                self.error_occurred.emit(self.folder_id, str(e))
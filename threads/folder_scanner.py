@@ -118,45 +118,75 @@ class FolderScanner(QThread):
         total_items = 0
         processed_items = 0
 
-        # First pass: count total items for progress (EXCLUDE .tif files from count)
-        for root, dirs, files in os.walk(root_path):
-            # Count directories
+        # First pass: read every directory once with os.scandir and count total
+        # items for progress (EXCLUDE .tif files from count). The listings are kept
+        # so the second pass does not read the directories again, and file sizes
+        # come from the DirEntry instead of a separate getsize() per file
+        listings = []  # (rel_path, subfolder_names, file_entries)
+        pending_dirs = [('', root_path)]
+        while pending_dirs:
+            if self._should_stop:
+                break
+
+            rel_path, root = pending_dirs.pop()
+            # Child paths are built from a per-directory prefix instead of os.path.join
+            rel_prefix = rel_path + os.sep if rel_path else ''
+
+            dirs = []
+            file_entries = []
+            subdirs = []
+            try:
+                with os.scandir(root) as entries:
+                    for entry in entries:
+                        try:
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            is_dir = False
+                        if is_dir:
+                            dirs.append(entry.name)
+                            # Like os.walk: do not follow symlinked directories
+                            if not entry.is_symlink():
+                                subdirs.append((rel_prefix + entry.name, entry.path))
+                        else:
+                            file_entries.append(entry)
+            except OSError as e:
+                print(f"⚠️ Cannot scan folder {root}: {e}")
+                continue
+
+            # Pushed in reverse so the stack pops siblings in listing order (os.walk order)
+            pending_dirs.extend(reversed(subdirs))
+
+            listings.append((rel_path, dirs, file_entries))
             total_items += len(dirs)
-            # Count files but EXCLUDE .tif files
-            for file_name in files:
-                if not file_name.lower().endswith('.tif'):
-                    total_items += 1
+            total_items += sum(1 for entry in file_entries if not entry.name.lower().endswith('.tif'))
 
         print(f"📊 Total items to process (excluding .tif): {total_items}")
 
-        # Second pass: collect structure and files
-        for root, dirs, files in os.walk(root_path):
+        # Second pass: collect structure and files from the cached listings
+        for rel_path, dirs, file_entries in listings:
             if self._should_stop:
                 break
 
-            # Calculate relative path from root
-            rel_path = os.path.relpath(root, root_path)
-            if rel_path == '.':
-                rel_path = ''
-
             # Store subfolder names
             if dirs:
                 folder_structure[rel_path] = dirs
 
             # Process files in this directory
-            for file_name in files:
+            for entry in file_entries:
                 if self._should_stop:
                     break
 
+                file_name = entry.name
+
                 # EXCLUDE .tif files completely
                 if file_name.lower().endswith('.tif'):
                     print(f"⏭️ Skipping .tif file: {file_name}")
                     continue
 
-                file_path = os.path.join(root, file_name)
+                file_path = entry.path
 
                 try:
-                    file_size = os.path.getsize(file_path)
+                    file_size = entry.stat().st_size
 
                     file_info = {
                         'file_path': file_path,
@@ -185,6 +215,28 @@ class FolderScanner(QThread):
         print(f"📊 Files collected (excluding .tif): {len(all_files)}")
         return folder_structure, all_files
 
+    def _create_folder_with_retry(self, folder_name: str, parent_id: str,
+                                  retry_count: int = 3) -> Optional[str]:
+        """
+        Create a single Drive folder, retrying on failure
+
+        Args:
+            folder_name: Name of the folder to create
+            parent_id: Drive ID of the parent folder
+            retry_count: Number of attempts
+
+        Returns:
+            Drive ID of the created folder, or None if every attempt failed
+        """
+        for attempt in range(retry_count):
+            try:
+                return self.drive_client.create_folder(folder_name, parent_id, self.is_shared_drive)
+            except Exception as e:
+                print(f"⚠️ Retry {attempt+1}/{retry_count} - Failed to create folder '{folder_name}': {e}")
+                if attempt < retry_count - 1:
+                    time.sleep(1)
+        return None
+
     def _add_files_to_queue(self, all_files: List[Dict[str, str]],
                           folder_mapping: Dict[str, str]) -> int:
         """
@@ -313,53 +365,71 @@ class FolderScanner(QThread):
                 else:
                     subfolder_rel_path = os.path.join(rel_path, subfolder_name)
                 all_folders_to_create.append(subfolder_rel_path)
-        all_folders_to_create.sort(key=lambda x: x.count(os.sep))
+        # Regrouper par profondeur: un niveau ne dépend que des IDs du niveau précédent
+        levels: Dict[int, List[str]] = {}
         for subfolder_rel_path in all_folders_to_create:
+            levels.setdefault(subfolder_rel_path.count(os.sep), []).append(subfolder_rel_path)
+
+        # Dossiers créés pendant ce scan: ils sont vides, inutile d'y chercher un conflit
+        created_ids = {main_folder_id} if not use_existing else set()
+
+        for depth in sorted(levels):
             if self._should_stop:
                 break
-            if subfolder_rel_path in folder_mapping:
+
+            to_create: List[Tuple[str, str, str]] = []  # (rel_path, nom, ID parent)
+            for subfolder_rel_path in levels[depth]:
+                if subfolder_rel_path in folder_mapping:
+                    continue
+                parent_rel_path = os.path.dirname(subfolder_rel_path)
+                if parent_rel_path == '.':
+                    parent_rel_path = ''
+                parent_drive_id = folder_mapping.get(parent_rel_path, main_folder_id)
+                subfolder_name = os.path.basename(subfolder_rel_path)
+
+                if parent_drive_id not in created_ids:
+                    try:
+                        existing_folders = self.drive_client.find_folder_by_name_in_parent(parent_drive_id, subfolder_name)
+                    except Exception as e:
+                        print(f"⚠️ Failed to check folder '{subfolder_name}' at '{subfolder_rel_path}': {e}")
+                        existing_folders = []
+                    if existing_folders:
+                        user_choice = self._get_user_folder_conflict_decision(subfolder_name, os.path.join(root_path, parent_rel_path))
+                        if user_choice == 'use_existing':
+                            subfolder_id = existing_folders[0]['id']
+                            folder_mapping[subfolder_rel_path] = subfolder_id
+                            self.folder_created.emit(os.path.join(root_path, subfolder_rel_path), subfolder_name, subfolder_id)
+                            continue
+                        elif user_choice != 'create_new':
+                            # User cancelled, use parent folder as fallback
+                            folder_mapping[subfolder_rel_path] = parent_drive_id
+                            continue
+
+                to_create.append((subfolder_rel_path, subfolder_name, parent_drive_id))
+
+            if not to_create:
                 continue
-            parent_rel_path = os.path.dirname(subfolder_rel_path)
-            if parent_rel_path == '.':
-                parent_rel_path = ''
-            parent_drive_id = folder_mapping.get(parent_rel_path, main_folder_id)
-            subfolder_name = os.path.basename(subfolder_rel_path)
-            retry_count = 3
-            subfolder_id = None
+
+            # Tous les dossiers du niveau en un batch HTTP (jusqu'à 100 créations par requête)
             try:
-                existing_folders = self.drive_client.find_folder_by_name_in_parent(parent_drive_id, subfolder_name)
-                use_existing = False
-                if existing_folders:
-                    user_choice = self._get_user_folder_conflict_decision(subfolder_name, os.path.join(root_path, parent_rel_path))
-                    if user_choice == 'use_existing':
-                        subfolder_id = existing_folders[0]['id']
-                        use_existing = True
-                    elif user_choice == 'create_new':
-                        use_existing = False
-                    else:
-                        # User cancelled, use parent folder as fallback
-                        folder_mapping[subfolder_rel_path] = parent_drive_id
-                        continue
-
-                if not use_existing:
-                    creation_success = False
-                    for attempt in range(retry_count):
-                        try:
-                            subfolder_id = self.drive_client.create_folder(
-                                subfolder_name, parent_drive_id, self.is_shared_drive
-                            )
-                            creation_success = True
-                            break
-                        except Exception as e:
-                            print(f"⚠️ Retry {attempt+1}/{retry_count} - Failed to create folder '{subfolder_name}': {e}")
-                            if attempt == retry_count - 1:
-                                # All retries failed
-                                raise Exception(f"Failed to create folder '{subfolder_name}' after {retry_count} attempts: {e}")
-                            time.sleep(1)
-
-                # Only proceed if we have a valid folder ID
+                batch_ids, batch_errors = self.drive_client.create_folders_batch(
+                    [(name, parent_drive_id) for _, name, parent_drive_id in to_create]
+                )
+            except Exception as e:
+                print(f"⚠️ Batch folder creation failed at depth {depth}: {e}")
+                batch_ids, batch_errors = [None] * len(to_create), {}
+
+            for index, ((subfolder_rel_path, subfolder_name, parent_drive_id), subfolder_id) in enumerate(
+                    zip(to_create, batch_ids)):
+                if subfolder_id is None:
+                    # Échec dans le batch: création individuelle avec retries
+                    if index in batch_errors:
+                        print(f"⚠️ Batch creation failed for '{subfolder_name}': {batch_errors[index]}")
+                    subfolder_id = self._create_folder_with_retry(subfolder_name, parent_drive_id)
+
                 if subfolder_id:
                     folder_mapping[subfolder_rel_path] = subfolder_id
+                    created_ids.add(subfolder_id)
                     local_subfolder_path = os.path.join(root_path, subfolder_rel_path)
                     self.folder_created.emit(local_subfolder_path, subfolder_name, subfolder_id)
                     print(f"✅ Created folder: {subfolder_rel_path} -> {subfolder_id}")
@@ -368,14 +438,6 @@ class FolderScanner(QThread):
                     folder_mapping[subfolder_rel_path] = parent_drive_id
                     print(f"⚠️ Using parent folder as fallback for '{subfolder_name}'")
 
-            except Exception as e:
-                print(f"⚠️ Failed to create folder '{subfolder_name}' at '{subfolder_rel_path}': {e}")
-                # Use parent folder as fallback
-                folder_mapping[subfolder_rel_path] = parent_drive_id
-
-            # Small delay between folder creations to avoid rate limiting
-            time.sleep(0.05)
-
         return folder_mapping
 
     def _add_files_to_queue(self, all_files: List[Dict[str, str]],
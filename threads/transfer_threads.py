@@ -3,16 +3,35 @@ Threads améliorés et sécurisés pour les opérations d'upload et download ave
 """
 
 import os
+import stat
 import time
+import queue
 import threading
-from typing import Optional, List, Dict, Any
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from PyQt5.QtCore import QThread, pyqtSignal, QMutex, QMutexLocker
+from collections import deque
+from typing import Optional, List, Dict, Any, Tuple, NamedTuple, Callable
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from PyQt5.QtCore import QThread, QTimer, pyqtSignal
 import random
-from utils.google_drive_utils import already_exists_in_folder
+from googleapiclient.errors import HttpError
+from utils.google_drive_utils import already_exists_in_folder, prefetch_folder_listings, remember_uploaded
 
+from config.settings import (PARALLEL_DOWNLOAD_THRESHOLD, PREFETCH_MAX_FILE_SIZE,
+                             LARGE_FILE_THRESHOLD, LARGE_FILE_MAX_PARALLEL,
+                             ADAPTIVE_UPLOAD_MAX_PARALLEL)
+from config.upload_config import upload_config_manager
 from core.google_drive_client import GoogleDriveClient
-from models.transfer_models import TransferManager, TransferType, TransferStatus
+from models.transfer_models import TransferManager, TransferType, TransferStatus, FileTransferItem
+
+# Pool de threads partagé par tous les transferts (uploads de dossiers, retries):
+# évite de créer et détruire un pool par transfert. Chaque transfert borne
+# lui-même le nombre de ses tâches en vol (fenêtre adaptative). Les threads sont
+# créés à la demande: la taille par défaut permet à plusieurs transferts (jusqu'à
+# ADAPTIVE_UPLOAD_MAX_PARALLEL tâches chacun) de tourner en même temps sans attendre
+# un worker.
+_TRANSFER_POOL = ThreadPoolExecutor(
+    max_workers=int(os.getenv("ZYM_TRANSFER_WORKERS", str(max(32, (os.cpu_count() or 1) * 4)))),
+    thread_name_prefix="transfer"
+)
 
 
 class SafeGoogleDriveUploader:
@@ -25,25 +44,52 @@ class SafeGoogleDriveUploader:
     _rate_limit_window = 3  # 1 minute
     _max_uploads_per_window = 1700  # Maximum 100 uploads par minute
 
-    @staticmethod
-    def get_fresh_client():
+    # Statuts HTTP pour lesquels un retry avec backoff est utile
+    _backoff_statuses = (429, 500, 502, 503, 504)
+
+    # Credentials OAuth partagés par tous les clients créés ici
+    _credentials = None
+    _credentials_lock = threading.Lock()
+
+    @classmethod
+    def _get_credentials(cls):
+        """Charge les credentials OAuth une seule fois pour tout le processus"""
+        with cls._credentials_lock:
+            if cls._credentials is None:
+                cls._credentials = GoogleDriveClient.load_credentials()
+            return cls._credentials
+
+    @classmethod
+    def reset_credentials(cls) -> None:
+        """Oublie les credentials en cache (déconnexion, changement de compte)"""
+        with cls._credentials_lock:
+            cls._credentials = None
+
+    @classmethod
+    def get_fresh_client(cls):
         """Crée une nouvelle instance de client Google Drive"""
-        from core.google_drive_client import GoogleDriveClient
-        return GoogleDriveClient()
+        return GoogleDriveClient(credentials=cls._get_credentials())
 
     @classmethod
     def safe_upload_file(cls, file_path: str,
                          parent_id: str, is_shared_drive: bool = False,
-                         max_retries: int = 3) -> str:
+                         max_retries: int = 5,
+                         drive_client: Optional[GoogleDriveClient] = None,
+                         data: Optional[bytes] = None,
+                         on_backoff: Optional[Callable[[], None]] = None) -> str:
         """
         Upload sécurisé d'un fichier avec retry et rate limiting
 
         Args:
-            drive_client: Client Google Drive
             file_path: Chemin du fichier
             parent_id: ID du dossier parent
             is_shared_drive: Si c'est un shared drive
             max_retries: Nombre maximum de tentatives
+            drive_client: Client à réutiliser (optionnel). Sinon un nouveau
+                client est créé, puis fermé, à chaque tentative.
+            data: Contenu du fichier déjà lu en mémoire (optionnel)
+            on_backoff: Appelé à chaque backoff (limitation de débit / erreur
+                temporaire), ex: pour ralentir le transfert appelant (optionnel)
 
         Returns:
             ID du fichier uploadé
@@ -71,49 +117,293 @@ class SafeGoogleDriveUploader:
                     cls._upload_count += 1
                     cls._last_upload_time = current_time
 
-                # Ajouter un délai aléatoire pour éviter les collisions
-                if attempt > 0:
-                    time.sleep(random.uniform(0.05, 0.08) * attempt)
-
-                # Tentative d'upload avec un nouveau client
-                drive_client = cls.get_fresh_client()
+                # Tentative d'upload avec le client fourni ou un nouveau client
+                client = drive_client or cls.get_fresh_client()
                 try:
-                    file_id = drive_client.upload_file(
-                        file_path, parent_id, None, None, is_shared_drive
-                    )
-                    return file_id
-                except Exception as e:
+                    try:
+                        file_id = client.upload_file(
+                            file_path, parent_id, None, None, is_shared_drive, data
+                        )
+                        remember_uploaded(parent_id, os.path.basename(file_path))
+                        return file_id
+                    except Exception as e:
 
-                    # Vérifier si le fichier existe déjà dans le dossier
-                    file_name = os.path.basename(file_path)
-                    if already_exists_in_folder(drive_client, parent_id, file_name):
-                        # Si le fichier existe déjà, on peut skip
-                        drive_client.close()
-                        break
+                        # Vérifier si le fichier existe déjà dans le dossier. Le serveur a pu
+                        # valider l'upload avant l'erreur (ex: timeout): la réponse en cache,
+                        # obtenue avant l'upload, ne peut pas le savoir
+                        file_name = os.path.basename(file_path)
+                        exists = already_exists_in_folder(client, parent_id, file_name, use_cache=False)
 
-                    # Fermer le client en cas d'erreur
-                    drive_client.close()
-                    raise e
+                        if exists:
+                            # Si le fichier existe déjà, on peut skip
+                            break
+                        raise e
+                finally:
+                    # Fermer le client dans tous les cas (seulement s'il a été créé ici),
+                    # y compris si la re-vérification lève (ex: limitation de débit)
+                    if client is not drive_client:
+                        client.close()
 
             except Exception as e:
-                error_msg = str(e).lower()
-
-                # Erreurs qui méritent un retry
-                if any(keyword in error_msg for keyword in [
-                    'ssl', 'timeout', 'connection', 'rate', 'quota', 'temporary'
-                ]):
-                    if attempt < max_retries - 1:
-                        wait_time = (2 ** attempt) + random.uniform(0, 1)  # Exponential backoff
-                        print(f"Erreur temporaire, retry dans {wait_time:.1f}s: {e}")
-                        time.sleep(wait_time)
-                        continue
+                # Backoff exponentiel uniquement sur limitation de débit / erreur temporaire
+                if attempt < max_retries - 1 and cls._should_backoff(e):
+                    if on_backoff:
+                        on_backoff()
+                    wait_time = min(64, (2 ** attempt) + random.random())
+                    print(f"Erreur temporaire, retry dans {wait_time:.1f}s: {e}")
+                    time.sleep(wait_time)
+                    continue
 
                 # Erreur finale ou non-recoverable
-                if attempt == max_retries - 1:
-                    raise e
+                raise e
 
         raise Exception("Upload échoué après tous les retries")
 
+    @classmethod
+    def _should_backoff(cls, error: Exception) -> bool:
+        """
+        Indique si une erreur justifie un nouvel essai après backoff
+
+        Args:
+            error: Exception levée par l'upload
+
+        Returns:
+            True pour les erreurs 429/5xx, les 403 de limitation de débit
+            et les erreurs réseau temporaires
+        """
+        if isinstance(error, HttpError):
+            status = error.resp.status
+            if status in cls._backoff_statuses:
+                return True
+            return status == 403 and 'ratelimitexceeded' in str(error).lower()
+
+        # Erreurs réseau (hors réponse HTTP)
+        error_msg = str(error).lower()
+        return any(keyword in error_msg for keyword in ('ssl', 'timeout', 'connection', 'temporary'))
+
+
+class FileEntry(NamedTuple):
+    """Fichier à uploader, collecté lors du parcours d'un dossier (enregistrement compact)"""
+    file_path: str
+    file_name: str
+    relative_dir: str
+    size: int
+    inode: int
+
+
+class AdaptiveConcurrency:
+    """
+    Ajuste le nombre d'uploads simultanés d'un transfert selon le débit observé
+
+    Toutes les `interval` secondes, le débit de la période (octets des fichiers
+    réellement envoyés) est lissé par moyenne mobile exponentielle: un gros
+    fichier qui se termine ou une série de fichiers ignorés ne suffit pas à
+    faire varier la fenêtre. La concurrence augmente tant que le débit lissé
+    progresse, diminue quand il chute ou quand un upload de CE transfert a dû
+    faire un backoff (limitation de débit).
+    """
+
+    def __init__(self, initial: int, minimum: int, maximum: int,
+                 interval: float = 5.0, smoothing: float = 0.3):
+        """
+        Args:
+            initial: Nombre d'uploads simultanés au départ
+            minimum: Borne inférieure
+            maximum: Borne supérieure
+            interval: Durée d'une période de mesure en secondes
+            smoothing: Poids d'une nouvelle période dans le débit lissé (0-1)
+        """
+        self.minimum = minimum
+        self.maximum = maximum
+        self.current = max(minimum, min(initial, maximum))
+        self.interval = interval
+        self.smoothing = smoothing
+        self._period_start = time.monotonic()
+        self._period_bytes = 0
+        self._period_files = 0
+        self._rate: Optional[float] = None
+        # Backoffs signalés par les threads de travail (record_backoff)
+        self._backoff_lock = threading.Lock()
+        self._backoffs = 0
+        self._period_backoffs = 0
+
+    def record_backoff(self) -> None:
+        """Signale un backoff d'un upload du transfert (appelé depuis les threads de travail)"""
+        with self._backoff_lock:
+            self._backoffs += 1
+
+    def record(self, size: int) -> None:
+        """
+        Comptabilise un fichier terminé et réévalue la concurrence en fin de période
+
+        Args:
+            size: Taille du fichier en bytes, 0 s'il n'a pas été envoyé (ignoré, échec)
+        """
+        if size:
+            self._period_bytes += size
+            self._period_files += 1
+        now = time.monotonic()
+        elapsed = now - self._period_start
+        if elapsed < self.interval:
+            return
+
+        with self._backoff_lock:
+            backoffs = self._backoffs - self._period_backoffs
+            self._period_backoffs = self._backoffs
+
+        if backoffs:
+            self.current = max(self.current - 1, self.minimum)
+        elif self._period_files:
+            # Période sans fichier envoyé (uniquement des fichiers ignorés): pas de mesure
+            previous = self._rate
+            rate = self._period_bytes / elapsed
+            self._rate = rate if previous is None else previous + self.smoothing * (rate - previous)
+            if previous is not None:
+                if self._rate > previous * 1.05:
+                    self.current = min(self.current + 2, self.maximum)
+                elif self._rate < previous * 0.95:
+                    self.current = max(self.current - 1, self.minimum)
+
+        self._period_start = now
+        self._period_bytes = 0
+        self._period_files = 0
+
+
+class ThreadLocalDriveClients:
+    """
+    Un client Google Drive par thread de travail
+
+    Chaque client garde sa connexion HTTPS ouverte (keep-alive) d'un fichier à
+    l'autre; httplib2 n'étant pas thread-safe, un client n'est jamais partagé
+    entre threads.
+    """
+
+    def __init__(self):
+        self._thread_local = threading.local()
+        self._clients: List[GoogleDriveClient] = []
+        self._clients_lock = threading.Lock()
+
+    def get(self) -> GoogleDriveClient:
+        """Retourne le client du thread courant, créé au premier appel"""
+        client = getattr(self._thread_local, 'client', None)
+        if client is None:
+            client = SafeGoogleDriveUploader.get_fresh_client()
+            self._thread_local.client = client
+            with self._clients_lock:
+                self._clients.append(client)
+        return client
+
+    def close_all(self) -> None:
+        """Ferme tous les clients créés"""
+        with self._clients_lock:
+            for client in self._clients:
+                try:
+                    client.close()
+                except Exception:
+                    pass
+            self._clients = []
+        self._thread_local = threading.local()
+
+
+class FolderMapping:
+    """
+    Correspondance chemin relatif -> ID Drive, remplie pendant la création des dossiers
+
+    Les uploads démarrent avant la fin de la création de l'arborescence: get()
+    attend que le dossier demandé soit créé, ou que la création soit terminée.
+    """
+
+    def __init__(self, root_id: str):
+        self._ids: Dict[str, str] = {'': root_id}
+        self._condition = threading.Condition()
+        self._closed = False
+
+    def set(self, rel_path: str, folder_id: str) -> None:
+        """Publie l'ID d'un dossier créé (ou existant) et réveille les uploads en attente"""
+        with self._condition:
+            self._ids[rel_path] = folder_id
+            self._condition.notify_all()
+
+    def close(self) -> None:
+        """Signale la fin de la création: get() ne bloque plus"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def get(self, rel_path: str, default: Optional[str] = None) -> Optional[str]:
+        """
+        Retourne l'ID Drive d'un dossier, en attendant sa création si nécessaire
+
+        Args:
+            rel_path: Chemin relatif du dossier
+            default: Valeur retournée si le dossier n'a pas pu être créé
+
+        Returns:
+            ID du dossier ou default
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._closed or rel_path in self._ids)
+            return self._ids.get(rel_path, default)
+
+
+class TransferStatusWriter:
+    """
+    Applique les statuts de fichiers au TransferManager par lots
+
+    Les workers déposent leurs mises à jour dans une file; un thread dédié les
+    applique via update_file_statuses_bulk toutes les 100 ms ou par lots de 50,
+    au lieu d'un recalcul du dossier (et d'un signal) par fichier.
+    """
+
+    def __init__(self, transfer_manager: TransferManager,
+                 batch_size: int = 50, flush_interval: float = 0.1):
+        self.transfer_manager = transfer_manager
+        self._queue = queue.SimpleQueue()
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Démarre le thread d'écriture"""
+        self._thread = threading.Thread(target=self._drain, daemon=True)
+        self._thread.start()
+
+    def put(self, transfer_id: str, file_path: str, status: TransferStatus,
+            progress: int = 0, error_message: str = "", speed: float = 0) -> None:
+        """Met en file une mise à jour (mêmes arguments que update_file_status_in_transfer)"""
+        self._queue.put((transfer_id, file_path, status, progress, error_message, speed))
+
+    def stop(self) -> None:
+        """Applique les mises à jour restantes puis arrête le thread d'écriture"""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def _drain(self) -> None:
+        """Boucle du thread d'écriture, jusqu'à la sentinelle None"""
+        while True:
+            batch = []
+            stop = False
+            deadline = time.monotonic() + self._flush_interval
+            while len(batch) < self._batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    update = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if update is None:
+                    stop = True
+                    break
+                batch.append(update)
+
+            if batch:
+                self.transfer_manager.update_file_statuses_bulk(batch)
+            if stop:
+                return
+
 
 class UploadThread(QThread):
     """Thread amélioré pour uploader les fichiers avec gestion robuste des erreurs"""
@@ -130,6 +420,10 @@ class UploadThread(QThread):
         """
         Initialise le thread d'upload sécurisé
 
+        Le fichier n'est jamais chargé entièrement en mémoire: l'upload
+        resumable le lit et l'envoie chunk par chunk (voir
+        GoogleDriveClient._upload_chunk_size).
+
         Args:
             drive_client: Client Google Drive
             file_path: Chemin du fichier à uploader
@@ -143,7 +437,11 @@ class UploadThread(QThread):
         self.parent_id = parent_id
         self.is_shared_drive = is_shared_drive
         self.transfer_manager = transfer_manager
-        self.file_size = os.path.getsize(file_path) if os.path.isfile(file_path) else 0
+        try:
+            file_stat = os.stat(file_path)
+            self.file_size = file_stat.st_size if stat.S_ISREG(file_stat.st_mode) else 0
+        except OSError:
+            self.file_size = 0
         self.transfer_id: Optional[str] = None
         self.is_cancelled = False
         self.start_time = 0
@@ -238,157 +536,217 @@ class SafeFolderUploadThread(QThread):
         self.uploaded_files = 0
         self.failed_files = 0
         self.transfer_id: Optional[str] = None
+        # Simple booléen: lecture/écriture atomiques sous le GIL, sans mutex
         self.is_cancelled = False
         self.start_time = 0
         self.total_size = 0
 
-        # Mutex pour protéger les accès concurrents
-        self.progress_mutex = QMutex()
-        self.cancelled_mutex = QMutex()
+        # Compteurs de progrès mis à jour uniquement depuis ce QThread (voir _record_result)
+        self._progress_stride = 1  # Progrès émis tous les N fichiers, calculé dans run()
+        self._progress_scale = 0.0  # 100 / nombre de fichiers, calculé dans run()
+        self._bytes_done = 0  # Somme des tailles réelles des fichiers traités
+
+        # Un client par thread de travail, réutilisé d'un fichier à l'autre (keep-alive)
+        self._clients = ThreadLocalDriveClients()
+
+        # Statuts de fichiers appliqués par lots par un thread dédié
+        self._file_statuses = TransferStatusWriter(transfer_manager) if transfer_manager else None
+
+        # Résumé des statuts mis à jour par fichier, émis par le timer d'interface
+        self._status_lock = threading.Lock()
+        self._status_counts = {'uploaded': 0, 'skipped': 0, 'error': 0}
+        self._status_last_file = ""
+        self._status_dirty = False
+
+        # Progrès et statut coalescés: ce thread n'enregistre que les dernières
+        # valeurs, un timer du thread principal les émet au plus 10 fois par seconde
+        self._pending_progress = -1
+        self._last_emitted_progress = -1
+        self._ui_timer = QTimer(self)
+        self._ui_timer.setInterval(100)
+        self._ui_timer.timeout.connect(self._flush_ui)
+        self.started.connect(self._ui_timer.start)
+        self.finished.connect(self._ui_timer.stop)
+
+    def scan_folder_tree(self, folder_path: str) -> Tuple[int, int, Dict[int, List[str]], List[FileEntry]]:
+        """
+        Parcourt l'arborescence une seule fois (parcours en largeur via os.scandir)
+
+        Un seul passage fournit le comptage, la taille totale, les sous-dossiers à
+        créer et la liste des fichiers à uploader. Le type des entrées provient de
+        la lecture du dossier et la taille du stat mis en cache par DirEntry.
 
-    def count_files_and_size(self, path: str) -> tuple:
-        """Compte les fichiers et leur taille totale"""
-        count = 0
+        Args:
+            folder_path: Chemin du dossier racine
+
+        Returns:
+            Tuple (nombre de fichiers, taille totale, sous-dossiers par profondeur,
+            fichiers à uploader triés par profondeur, dossier puis inode)
+        """
         total_size = 0
-        try:
-            for root, dirs, files in os.walk(path):
-                for file in files:
-                    if not file.lower().endswith('.tif'):
-                        file_path = os.path.join(root, file)
+        levels: Dict[int, List[str]] = {}
+        files_to_process = []
+
+        pending_dirs = deque([('', folder_path, 0)])
+        while pending_dirs:
+            rel_path, local_path, depth = pending_dirs.popleft()
+            # Préfixe calculé une fois par dossier pour les chemins relatifs des sous-dossiers
+            rel_prefix = f"{rel_path}{os.sep}" if rel_path else ""
+            try:
+                with os.scandir(local_path) as entries:
+                    for entry in entries:
                         try:
-                            count += 1
-                            total_size += os.path.getsize(file_path)
-                        except (OSError, IOError):
+                            if entry.is_dir():
+                                # Comme os.walk: ne pas suivre les liens symboliques de dossiers
+                                if not entry.is_symlink():
+                                    child_rel_path = rel_prefix + entry.name
+                                    levels.setdefault(depth, []).append(child_rel_path)
+                                    pending_dirs.append((child_rel_path, entry.path, depth + 1))
+                                continue
+
+                            if entry.name.lower().endswith('.tif'):
+                                continue
+
+                            size = entry.stat().st_size
+                            files_to_process.append(FileEntry(entry.path, entry.name, rel_path, size, entry.inode()))
+                            total_size += size
+                        except OSError:
                             pass
-        except Exception:
-            pass
-        return count, total_size
+            except OSError as e:
+                print(f"Erreur lors du parcours de {local_path}: {e}")
 
-    def collect_all_files(self, folder_path: str) -> List[Dict[str, Any]]:
-        """Collecte tous les fichiers de manière récursive et les ajoute au TransferManager"""
-        files_to_process = []
+        # Dossiers dans leur ordre de création (niveau par niveau): les premiers fichiers
+        # envoyés ont déjà leur dossier de destination. Puis regroupement par dossier
+        # et par inode: lectures disque plus séquentielles et vérifications d'existence
+        # groupées par dossier
+        files_to_process.sort(key=lambda info: (info.relative_dir.count(os.sep),
+                                                info.relative_dir, info.inode))
 
-        try:
-            for root, dirs, files in os.walk(folder_path):
-                rel_path = os.path.relpath(root, folder_path)
-
-                for file in files:
-                    if not file.lower().endswith('.tif'):
-                        file_path = os.path.join(root, file)
-                        if os.path.exists(file_path):
-                            file_info = {
-                                'file_path': file_path,
-                                'file_name': file,
-                                'relative_dir': rel_path if rel_path != '.' else '',
-                                'size': os.path.getsize(file_path)
-                            }
-                            files_to_process.append(file_info)
-
-                            # Créer un FileTransferItem et l'ajouter au transfert
-                            if self.transfer_manager and self.transfer_id:
-                                from models.transfer_models import FileTransferItem
-                                file_item = FileTransferItem(
-                                    file_path=file_path,
-                                    file_name=file,
-                                    file_size=file_info['size'],
-                                    relative_path=rel_path if rel_path != '.' else '',
-                                    destination_folder_id=""  # Sera mis à jour plus tard
-                                )
-                                self.transfer_manager.add_file_to_transfer(self.transfer_id, file_item)
+        return len(files_to_process), total_size, levels, files_to_process
 
-        except Exception as e:
-            print(f"Erreur lors de la collecte des fichiers: {e}")
+    def register_files(self, files_to_process: List[FileEntry]) -> None:
+        """Ajoute un FileTransferItem au TransferManager pour chaque fichier à uploader"""
+        if not (self.transfer_manager and self.transfer_id):
+            return
+
+        for file_info in files_to_process:
+            file_item = FileTransferItem(
+                file_path=file_info.file_path,
+                file_name=file_info.file_name,
+                file_size=file_info.size,
+                relative_path=file_info.relative_dir,
+                destination_folder_id=""  # Sera mis à jour plus tard
+            )
+            self.transfer_manager.add_file_to_transfer(self.transfer_id, file_item)
 
-        return files_to_process
+    def create_folder_structure_safe(self, levels: Dict[int, List[str]], parent_id: str,
+                                     published: Optional[FolderMapping] = None) -> Dict[str, str]:
+        """
+        Crée la structure de dossiers niveau par niveau avec gestion des conflits
 
-    def create_folder_structure_safe(self, folder_path: str, parent_id: str) -> Dict[str, str]:
-        """Crée la structure de dossiers de manière sécurisée avec gestion des conflits"""
+        Les dossiers d'un même niveau de profondeur sont créés ensemble via des
+        requêtes batch, ce qui réduit le nombre d'allers-retours avec l'API.
+
+        Args:
+            levels: Chemins relatifs des sous-dossiers par profondeur (voir scan_folder_tree)
+            parent_id: ID du dossier Drive racine
+            published: Correspondance partagée avec les uploads en cours, alimentée
+                       dossier par dossier et fermée à la fin (optionnel)
+        """
         folder_mapping = {'': parent_id}
         retry_count = 3
 
+        # Tout ce qui peut lever est dans le try: published doit être fermé,
+        # sinon les uploads en attente d'un dossier bloqueraient indéfiniment
         try:
-            # Créer les dossiers un par un avec délais
-            for root, dirs, files in os.walk(folder_path):
-                rel_path = os.path.relpath(root, folder_path)
-
-                if rel_path == '.' or self.is_cancelled:
-                    continue
-
-                parent_rel_path = os.path.dirname(rel_path)
-                if parent_rel_path == '.':
-                    parent_rel_path = ''
+            use_existing = upload_config_manager.get_use_existing_folders()
+            fresh_client = self.get_fresh_client()
+            try:
+                for depth in sorted(levels):
+                    if self.is_cancelled:
+                        break
 
-                if parent_rel_path in folder_mapping:
-                    parent_drive_id = folder_mapping[parent_rel_path]
-                    folder_name = os.path.basename(root)
+                    # Dossiers à créer pour ce niveau: (rel_path, nom, ID parent)
+                    to_create = []
+                    existing_by_parent: Dict[str, Dict[str, str]] = {}
 
-                    self.status_signal.emit(f"📁 Création: {rel_path}")
+                    for rel_path in levels[depth]:
+                        parent_rel_path, _, folder_name = rel_path.rpartition(os.sep)
+                        parent_drive_id = folder_mapping.get(parent_rel_path)
+                        if parent_drive_id is None:
+                            continue
 
-                    # Vérifier si le dossier existe déjà
-                    folder_id = None
-                    try:
-                        fresh_client = self.get_fresh_client()
+                        # Vérifier si le dossier existe déjà (une requête par dossier parent)
+                        if use_existing:
+                            if parent_drive_id not in existing_by_parent:
+                                try:
+                                    existing_by_parent[parent_drive_id] = {
+                                        folder['name']: folder['id']
+                                        for folder in reversed(fresh_client.list_child_folders(parent_drive_id))
+                                    }
+                                except Exception as e:
+                                    # En cas d'erreur lors de la vérification, on continue avec la création
+                                    self.status_signal.emit(f"⚠️ Erreur lors de la vérification du dossier: {str(e)}")
+                                    existing_by_parent[parent_drive_id] = {}
+
+                            existing_id = existing_by_parent[parent_drive_id].get(folder_name)
+                            if existing_id:
+                                folder_mapping[rel_path] = existing_id
+                                if published:
+                                    published.set(rel_path, existing_id)
+                                self.status_signal.emit(f"📁 Utilisation du dossier existant: {rel_path}")
+                                continue
+
+                        to_create.append((rel_path, folder_name, parent_drive_id))
+
+                    # Créer les dossiers manquants en batch, avec retry des échecs
+                    last_errors: Dict[str, Any] = {}
+                    for attempt in range(retry_count):
+                        if not to_create:
+                            break
+
+                        self.status_signal.emit(f"📁 Création: {len(to_create)} dossier(s) (niveau {depth + 1})")
                         try:
-                            existing_folders = fresh_client.find_folder_by_name_in_parent(parent_drive_id, folder_name)
-                            if existing_folders:
-                                # Vérifier la configuration utilisateur
-                                from config.upload_config import upload_config_manager
-                                use_existing = upload_config_manager.get_use_existing_folders()
-
-                                if use_existing:
-                                    # Utiliser le dossier existant selon la configuration
-                                    folder_id = existing_folders[0]['id']
-                                    self.status_signal.emit(f"📁 Utilisation du dossier existant: {rel_path}")
-                                else:
-                                    # Créer un nouveau dossier selon la configuration
-                                    folder_id = None
-                                    self.status_signal.emit(f"📁 Création d'un nouveau dossier (même nom): {rel_path}")
+                            created_ids, errors = fresh_client.create_folders_batch(
+                                [(folder_name, parent_drive_id) for _, folder_name, parent_drive_id in to_create]
+                            )
+                        except Exception as e:
+                            created_ids = [None] * len(to_create)
+                            errors = dict.fromkeys(range(len(to_create)), e)
+
+                        failed = []
+                        for index, (entry, folder_id) in enumerate(zip(to_create, created_ids)):
+                            if folder_id:
+                                folder_mapping[entry[0]] = folder_id
+                                if published:
+                                    published.set(entry[0], folder_id)
                             else:
-                                # Le dossier n'existe pas, on va le créer
-                                folder_id = None
-                        finally:
-                            fresh_client.close()
-                    except Exception as e:
-                        # En cas d'erreur lors de la vérification, on continue avec la création
-                        self.status_signal.emit(f"⚠️ Erreur lors de la vérification du dossier: {str(e)}")
-                        folder_id = None
-
-                    # Si le dossier n'existe pas, on le crée avec retry
-                    if not folder_id:
-                        creation_success = False
-                        for attempt in range(retry_count):
-                            try:
-                                fresh_client = self.get_fresh_client()
-                                try:
-                                    folder_id = fresh_client.create_folder(
-                                        folder_name, parent_drive_id, self.is_shared_drive
-                                    )
-                                    creation_success = True
-                                finally:
-                                    fresh_client.close()
-                                break
-                            except Exception as e:
-                                self.status_signal.emit(f"⚠️ Retry {attempt+1}/{retry_count} - Erreur création dossier '{folder_name}': {str(e)}")
-                                if attempt < retry_count - 1:
-                                    time.sleep(1 + attempt)  # Délai progressif
-                                    continue
-                                else:
-                                    # Toutes les tentatives ont échoué
-                                    raise Exception(f"Échec de création du dossier '{folder_name}' après {retry_count} tentatives: {e}")
-
-                    # Si on a un ID de dossier valide, on l'ajoute au mapping
-                    if folder_id:
-                        folder_mapping[rel_path] = folder_id
-                    else:
-                        # Fallback au dossier parent si quelque chose s'est mal passé
-                        folder_mapping[rel_path] = parent_drive_id
-                        self.status_signal.emit(f"⚠️ Utilisation du dossier parent comme fallback pour '{folder_name}'")
+                                failed.append(entry)
+                                last_errors[entry[0]] = errors.get(index, "ID de dossier absent de la réponse")
+                        to_create = failed
+
+                        if to_create:
+                            first_error = last_errors[to_create[0][0]]
+                            self.status_signal.emit(
+                                f"⚠️ Retry {attempt+1}/{retry_count} - {len(to_create)} dossier(s) non créé(s): {first_error}"
+                            )
+
+                        if to_create and attempt < retry_count - 1:
+                            time.sleep(1 + attempt)  # Délai progressif
 
-                    # Petit délai entre créations de dossiers pour éviter les limitations de taux
-                    time.sleep(0.2)
+                    if to_create:
+                        # Toutes les tentatives ont échoué
+                        details = "; ".join(f"'{folder_name}': {last_errors[rel_path]}"
+                                            for rel_path, folder_name, _ in to_create[:3])
+                        raise Exception(f"Échec de création des dossiers après {retry_count} tentatives ({details})")
+            finally:
+                fresh_client.close()
 
         except Exception as e:
             self.error_signal.emit(f"Erreur création dossiers: {str(e)}")
+        finally:
+            if published:
+                published.close()
 
         return folder_mapping
 
@@ -396,26 +754,140 @@ class SafeFolderUploadThread(QThread):
         """Crée une nouvelle instance de client Google Drive"""
         return SafeGoogleDriveUploader.get_fresh_client()
 
-    def upload_files_batch_safe(self, file_batch: List[Dict[str, Any]],
-                               folder_mapping: Dict[str, str]) -> List[Dict[str, Any]]:
+    def _record_result(self, result: Dict[str, Any]) -> None:
+        """
+        Comptabilise le résultat d'un fichier et met à jour le transfert tous les N fichiers
+
+        Appelé uniquement depuis ce QThread, qui collecte les résultats des workers:
+        les compteurs n'ont pas besoin de verrou. L'horloge n'est lue qu'au moment
+        d'émettre.
+
+        Args:
+            result: Résultat retourné par l'upload d'un fichier
+        """
+        if result['success']:
+            self.uploaded_files += 1
+        else:
+            self.failed_files += 1
+        self._bytes_done += result['file_info'].size
+        done = self.uploaded_files + self.failed_files
+
+        progress = int(done * self._progress_scale)
+        if done == self.total_files:
+            # Progrès final émis directement pour précéder completed_signal
+            self._pending_progress = self._last_emitted_progress = progress
+            self.progress_signal.emit(progress)
+        else:
+            self._pending_progress = progress
+
+        # Toujours update à la fin
+        if done % self._progress_stride != 0 and done != self.total_files:
+            return
+
+        # Mettre à jour le transfert
+        if self.transfer_manager and self.transfer_id:
+            elapsed_time = time.time() - self.start_time
+            if elapsed_time > 0:
+                self.transfer_manager.update_transfer_progress(
+                    self.transfer_id, progress, self._bytes_done, self._bytes_done / elapsed_time
+                )
+
+    def _queue_status(self, result: Dict[str, Any]) -> None:
+        """
+        Comptabilise le statut d'un fichier pour le prochain résumé
+
+        Le résumé est émis par le timer d'interface (_flush_ui) plutôt qu'un
+        signal par fichier, ce qui saturerait la boucle d'événements de
+        l'interface sur les gros dossiers.
+
+        Args:
+            result: Résultat retourné par l'upload d'un fichier
+        """
+        if result.get('cancelled', False):
+            return
+
+        with self._status_lock:
+            if not result['success']:
+                self._status_counts['error'] += 1
+            elif result.get('skipped', False):
+                self._status_counts['skipped'] += 1
+            else:
+                self._status_counts['uploaded'] += 1
+            self._status_last_file = result['file_info'].file_name
+            self._status_dirty = True
+
+    def _flush_ui(self) -> None:
+        """Émet le dernier progrès et le résumé des statuts s'ils ont changé (thread principal)"""
+        progress = self._pending_progress
+        if progress != self._last_emitted_progress:
+            self._last_emitted_progress = progress
+            self.progress_signal.emit(progress)
+
+        with self._status_lock:
+            if not self._status_dirty:
+                return
+            self._status_dirty = False
+            counts = dict(self._status_counts)
+            last_file = self._status_last_file
+
+        message = f"✅ {counts['uploaded']} envoyé(s)"
+        if counts['skipped']:
+            message += f", ⏭️ {counts['skipped']} ignoré(s)"
+        if counts['error']:
+            message += f", ❌ {counts['error']} erreur(s)"
+        self.status_signal.emit(f"{message} — dernier: {last_file}")
+
+    @staticmethod
+    def _read_small_file(file_info: FileEntry) -> Optional[bytes]:
+        """
+        Lit un fichier en mémoire s'il est assez petit pour être préchargé
+
+        Returns:
+            Contenu du fichier, ou None s'il est trop gros ou illisible
+        """
+        if file_info.size > PREFETCH_MAX_FILE_SIZE:
+            return None
+        try:
+            with open(file_info.file_path, 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def upload_files_batch_safe(self, file_batch: List[FileEntry],
+                               folder_mapping: FolderMapping) -> List[Dict[str, Any]]:
         """Upload un batch de fichiers de manière ultra-sécurisée"""
         results = []
-
-        def upload_single_file_safe(file_info):
+        transfer = (self.transfer_manager.get_transfer(self.transfer_id)
+                    if self.transfer_manager and self.transfer_id else None)
+
+        # Fenêtre d'uploads en vol (mode parallèle): elle part de la valeur configurée
+        # (max_parallel_uploads), monte tant que le débit progresse et redescend en cas
+        # de limitation de débit ou de chute du débit
+        concurrency = AdaptiveConcurrency(
+            initial=self.max_parallel_uploads,
+            minimum=min(2, self.max_parallel_uploads),
+            maximum=max(self.max_parallel_uploads, ADAPTIVE_UPLOAD_MAX_PARALLEL)
+        ) if self.max_parallel_uploads > 1 else None
+
+        def upload_single_file_safe(file_info, data: Optional[bytes] = None):
             """Upload sécurisé d'un seul fichier avec tracking individuel"""
             try:
-                with QMutexLocker(self.cancelled_mutex):
-                    if self.is_cancelled:
-                        return {'success': False, 'cancelled': True, 'file_info': file_info}
+                if self.is_cancelled:
+                    return {'success': False, 'cancelled': True, 'file_info': file_info}
 
-                # Déterminer le dossier parent
-                parent_id = folder_mapping.get(file_info['relative_dir'], self.parent_id)
-                file_path = file_info['file_path']
-                file_name = file_info['file_name']
+                file_path = file_info.file_path
+                file_name = file_info.file_name
+                child = transfer.child_files.get(file_path) if transfer else None
+
+                # Déterminer le dossier parent (attend sa création si besoin). Un dossier
+                # non créé fait échouer ses fichiers plutôt que de les envoyer à la racine
+                parent_id = folder_mapping.get(file_info.relative_dir)
+                if parent_id is None:
+                    raise Exception(f"Dossier de destination non créé: {file_info.relative_dir}")
 
                 # Mettre à jour le statut du fichier dans le transfer manager
-                if self.transfer_manager and self.transfer_id:
-                    self.transfer_manager.update_file_status_in_transfer(
+                if transfer:
+                    self._file_statuses.put(
                         self.transfer_id, file_path, TransferStatus.IN_PROGRESS
                     )
 
@@ -423,15 +895,15 @@ class SafeFolderUploadThread(QThread):
                 start_time = time.time()
 
                 # Vérifier si le fichier existe déjà sur Drive
-                if already_exists_in_folder(SafeGoogleDriveUploader.get_fresh_client(), parent_id, file_name):
-                    if self.transfer_manager and self.transfer_id:
-                        self.transfer_manager.update_file_status_in_transfer(
+                client = self._clients.get()
+                if already_exists_in_folder(client, parent_id, file_name):
+                    if transfer:
+                        self._file_statuses.put(
                             self.transfer_id, file_path, TransferStatus.COMPLETED
                         )
-                        # Marquer le fichier comme existant
-                        transfer = self.transfer_manager.get_transfer(self.transfer_id)
-                        if transfer and file_path in transfer.child_files:
-                            transfer.child_files[file_path].exists_on_drive = True
+                    # Marquer le fichier comme existant
+                    if child:
+                        child.exists_on_drive = True
 
                     return {
                         'success': True,
@@ -442,24 +914,24 @@ class SafeFolderUploadThread(QThread):
 
                 # Upload sécurisé avec retry
                 file_id = SafeGoogleDriveUploader.safe_upload_file(
-                    file_info['file_path'], parent_id,
-                    self.is_shared_drive
+                    file_info.file_path, parent_id,
+                    self.is_shared_drive, drive_client=client, data=data,
+                    on_backoff=concurrency.record_backoff if concurrency else None
                 )
 
                 # Calculer la vitesse d'upload
                 upload_time = time.time() - start_time
-                file_speed = file_info['size'] / upload_time if upload_time > 0 else 0
+                file_speed = file_info.size / upload_time if upload_time > 0 else 0
 
                 # Mettre à jour le succès dans le transfer manager avec vitesse
-                if self.transfer_manager and self.transfer_id:
-                    self.transfer_manager.update_file_status_in_transfer(
+                if transfer:
+                    self._file_statuses.put(
                         self.transfer_id, file_path, TransferStatus.COMPLETED, 100, "", file_speed
                     )
-                    # Sauvegarder l'ID du fichier uploadé
-                    transfer = self.transfer_manager.get_transfer(self.transfer_id)
-                    if transfer and file_path in transfer.child_files:
-                        transfer.child_files[file_path].uploaded_file_id = file_id
-                        transfer.child_files[file_path].destination_folder_id = parent_id
+                # Sauvegarder l'ID du fichier uploadé
+                if child:
+                    child.uploaded_file_id = file_id
+                    child.destination_folder_id = parent_id
 
                 return {
                     'success': True,
@@ -469,8 +941,8 @@ class SafeFolderUploadThread(QThread):
 
             except Exception as e:
                 # Mettre à jour l'erreur dans le transfer manager
-                if self.transfer_manager and self.transfer_id:
-                    self.transfer_manager.update_file_status_in_transfer(
+                if transfer:
+                    self._file_statuses.put(
                         self.transfer_id, file_path, TransferStatus.ERROR, 0, str(e)
                     )
 
@@ -482,123 +954,83 @@ class SafeFolderUploadThread(QThread):
 
         # Upload séquentiel si max_parallel_uploads = 1, sinon parallèle limité
         if self.max_parallel_uploads == 1:
-            # Upload séquentiel - plus sûr
-            for file_info in file_batch:
+            # Upload séquentiel - plus sûr. Le fichier suivant est lu en mémoire
+            # pendant l'upload du fichier courant.
+            prefetch = None
+            for index, file_info in enumerate(file_batch):
                 if self.is_cancelled:
                     break
 
-                result = upload_single_file_safe(file_info)
+                data = prefetch.result() if prefetch else None
+                prefetch = None
+                if index + 1 < len(file_batch):
+                    prefetch = _TRANSFER_POOL.submit(self._read_small_file, file_batch[index + 1])
+
+                result = upload_single_file_safe(file_info, data)
                 results.append(result)
 
                 # Mettre à jour le progrès avec throttling
-                with QMutexLocker(self.progress_mutex):
-                    if result['success']:
-                        self.uploaded_files += 1
-                    else:
-                        self.failed_files += 1
-
-                    # Throttling des updates de progrès pour éviter la surcharge UI (optimisé)
-                    current_time = time.time()
-                    # Pour de gros volumes, réduire la fréquence des mises à jour
-                    update_interval = 1.0 if self.total_files > 500 else 0.5
-                    should_update = (
-                        (current_time - getattr(self, 'last_progress_update', 0)) > update_interval or
-                        self.uploaded_files + self.failed_files == self.total_files  # Toujours update à la fin
-                    )
-
-                    if should_update:
-                        self.last_progress_update = current_time
-                        progress = int(((self.uploaded_files + self.failed_files) / self.total_files) * 100)
-                        self.progress_signal.emit(progress)
+                self._record_result(result)
 
-                        # Mettre à jour le transfert
-                        if self.transfer_manager and self.transfer_id:
-                            elapsed_time = time.time() - self.start_time
-                            if elapsed_time > 0:
-                                avg_file_size = self.total_size / self.total_files if self.total_files > 0 else 0
-                                speed = ((self.uploaded_files + self.failed_files) * avg_file_size) / elapsed_time
-                                self.transfer_manager.update_transfer_progress(
-                                    self.transfer_id, progress,
-                                    int((self.uploaded_files + self.failed_files) * avg_file_size), speed
-                                )
-
-                # Status
-                if result['success']:
-                    if result.get('skipped', False):
-                        self.status_signal.emit(f"⏭️ Ignoré (existe): {result['file_info']['file_name']}")
-                    else:
-                        self.status_signal.emit(f"✅ Terminé: {result['file_info']['file_name']}")
-                else:
-                    if not result.get('cancelled', False):
-                        self.status_signal.emit(f"❌ Erreur: {result['file_info']['file_name']}")
+                # Status (regroupé)
+                self._queue_status(result)
 
-                # Délai entre uploads pour éviter le rate limiting (optimisé)
-                if not self.is_cancelled:
-                    # Délai adaptatif: plus court pour de gros volumes
-                    delay = 0.05 if self.total_files > 100 else 0.1
-                    time.sleep(delay)
         else:
-            # Upload parallèle très limité et sécurisé
-            with ThreadPoolExecutor(max_workers=self.max_parallel_uploads) as executor:
-                # Soumettre les uploads avec délais
-                futures = []
-                for i, file_info in enumerate(file_batch):
-                    if self.is_cancelled:
-                        break
-
-                    future = executor.submit(upload_single_file_safe, file_info)
-                    futures.append(future)
+            # Upload parallèle sur le pool partagé, avec une fenêtre glissante de fichiers
+            # en vol dont la taille s'adapte au débit observé
+
+            # Deux files selon la taille: les gros fichiers (limités à LARGE_FILE_MAX_PARALLEL
+            # en vol, démarrés en priorité) ne monopolisent pas la fenêtre au détriment
+            # des petits fichiers, limités par la latence plutôt que par le débit
+            small_files = iter([f for f in file_batch if f.size < LARGE_FILE_THRESHOLD])
+            large_files = iter([f for f in file_batch if f.size >= LARGE_FILE_THRESHOLD])
+            inflight = set()
+            large_inflight = set()
+            while True:
+                # Remplir la fenêtre
+                if not self.is_cancelled:
+                    while len(inflight) < concurrency.current:
+                        file_info = None
+                        if len(large_inflight) < LARGE_FILE_MAX_PARALLEL:
+                            file_info = next(large_files, None)
+                        is_large = file_info is not None
+                        if file_info is None:
+                            file_info = next(small_files, None)
+                        if file_info is None:
+                            break
+
+                        future = _TRANSFER_POOL.submit(upload_single_file_safe, file_info)
+                        inflight.add(future)
+                        if is_large:
+                            large_inflight.add(future)
+
+                if not inflight:
+                    break
 
-                    # Délai entre soumissions pour éviter la surcharge
-                    if i < len(file_batch) - 1:
-                        time.sleep(0.003)
+                done, inflight = wait(inflight, timeout=1.0, return_when=FIRST_COMPLETED)
+                large_inflight -= done
 
                 # Traiter les résultats
-                for future in as_completed(futures):
-                    if self.is_cancelled:
-                        break
-
+                for future in done:
                     result = future.result()
                     results.append(result)
 
-                    # Mettre à jour le progrès avec throttling (même code que séquentiel)
-                    with QMutexLocker(self.progress_mutex):
-                        if result['success']:
-                            self.uploaded_files += 1
-                        else:
-                            self.failed_files += 1
-
-                        # Throttling des updates de progrès pour éviter la surcharge UI
-                        current_time = time.time()
-                        should_update = (
-                            (current_time - getattr(self, 'last_progress_update', 0)) > 0.2 or  # Max 5 updates par seconde (amélioré)
-                            self.uploaded_files + self.failed_files == self.total_files  # Toujours update à la fin
-                        )
+                    # Seuls les fichiers réellement envoyés comptent dans le débit
+                    uploaded = result['success'] and not result.get('skipped', False)
+                    concurrency.record(result['file_info'].size if uploaded else 0)
 
-                        if should_update:
-                            self.last_progress_update = current_time
-                            progress = int(((self.uploaded_files + self.failed_files) / self.total_files) * 100)
-                            self.progress_signal.emit(progress)
+                    # Mettre à jour le progrès avec throttling
+                    self._record_result(result)
 
-                            if self.transfer_manager and self.transfer_id:
-                                elapsed_time = time.time() - self.start_time
-                                if elapsed_time > 0:
-                                    avg_file_size = self.total_size / self.total_files if self.total_files > 0 else 0
-                                    speed = ((self.uploaded_files + self.failed_files) * avg_file_size) / elapsed_time
-                                    self.transfer_manager.update_transfer_progress(
-                                        self.transfer_id, progress,
-                                        int((self.uploaded_files + self.failed_files) * avg_file_size), speed
-                                    )
-
-                    # Status
-                    if result['success']:
-                        if result.get('skipped', False):
-                            self.status_signal.emit(f"⏭️ Ignoré (existe): {result['file_info']['file_name']}")
-                        else:
-                            self.status_signal.emit(f"✅ Terminé: {result['file_info']['file_name']}")
-                    else:
-                        if not result.get('cancelled', False):
-                            self.status_signal.emit(f"❌ Erreur: {result['file_info']['file_name']}")
+                    # Status (regroupé)
+                    self._queue_status(result)
+
+                if self.is_cancelled:
+                    for future in inflight:
+                        future.cancel()
+                    # Attendre les uploads déjà démarrés avant de rendre la main
+                    wait(inflight)
+                    break
 
         return results
 
@@ -608,8 +1040,10 @@ class SafeFolderUploadThread(QThread):
         folder_name = os.path.basename(self.folder_path)
 
         try:
-            # Compter les fichiers
-            self.total_files, self.total_size = self.count_files_and_size(self.folder_path)
+            # Parcourir l'arborescence une seule fois
+            self.total_files, self.total_size, folder_levels, all_files = self.scan_folder_tree(self.folder_path)
+            self._progress_stride = max(1, self.total_files // 200)  # ~200 mises à jour au total
+            self._progress_scale = 100.0 / self.total_files if self.total_files else 0.0
 
             if self.total_files == 0:
                 self.status_signal.emit("📁 Dossier vide, création uniquement...")
@@ -641,40 +1075,44 @@ class SafeFolderUploadThread(QThread):
             finally:
                 fresh_client.close()
 
-            # Créer la structure de dossiers de manière sécurisée
+            # Créer la structure de dossiers en arrière-plan: les fichiers d'un dossier
+            # partent dès que son ID est connu, pendant que les niveaux suivants se créent
             self.status_signal.emit("📁 Création structure...")
-            folder_mapping = self.create_folder_structure_safe(self.folder_path, main_folder_id)
-
-            if self.is_cancelled:
-                return
-
-            # Collecter tous les fichiers
-            all_files = self.collect_all_files(self.folder_path)
+            folder_mapping = FolderMapping(main_folder_id)
+            folder_creator = threading.Thread(
+                target=self.create_folder_structure_safe,
+                args=(folder_levels, main_folder_id, folder_mapping),
+                daemon=True
+            )
+            folder_creator.start()
 
-            # Upload avec batch plus petits pour la sécurité
-            batch_size = max(1, min(100, len(all_files)))  # Batch très petit
-            file_batches = [all_files[i:i + batch_size] for i in range(0, len(all_files), batch_size)]
+            # Enregistrer les fichiers dans le transfert
+            self.register_files(all_files)
 
             self.status_signal.emit(f"⚡ Upload: {self.total_files} fichiers (mode: {'séquentiel' if self.max_parallel_uploads == 1 else 'parallèle limité'})...")
 
-            # Traiter chaque batch avec délais
-            all_errors = []
-            for i, batch in enumerate(file_batches):
-                if self.is_cancelled:
-                    break
-
-                self.status_signal.emit(f"📦 Batch {i+1}/{len(file_batches)} ({len(batch)} fichiers)...")
-                results = self.upload_files_batch_safe(batch, folder_mapping)
+            # Un seul passage sur tous les fichiers: la fenêtre glissante garde les
+            # workers occupés sans barrière de synchronisation entre lots
+            if self._file_statuses:
+                self._file_statuses.start()
+            try:
+                results = self.upload_files_batch_safe(all_files, folder_mapping)
+            finally:
+                folder_creator.join()
+                # Tous les statuts de fichiers appliqués avant le statut final
+                if self._file_statuses:
+                    self._file_statuses.stop()
 
-                # Collecter les erreurs
-                for result in results:
-                    if not result['success'] and not result.get('cancelled', False):
-                        error_msg = f"❌ {result['file_info']['file_name']}: {result.get('error', 'Erreur inconnue')}"
-                        all_errors.append(error_msg)
+            # Collecter les erreurs
+            all_errors = []
+            for result in results:
+                if not result['success'] and not result.get('cancelled', False):
+                    error_msg = f"❌ {result['file_info'].file_name}: {result.get('error', 'Erreur inconnue')}"
+                    all_errors.append(error_msg)
 
-                # Délai entre batches pour éviter la surcharge
-                if i < len(file_batches) - 1 and not self.is_cancelled:
-                    time.sleep(0.0003)  # 1 seconde entre batches
+            # Le message final remplace le résumé en attente
+            with self._status_lock:
+                self._status_dirty = False
 
             if not self.is_cancelled:
                 # Rapport final
@@ -703,11 +1141,12 @@ class SafeFolderUploadThread(QThread):
                     self.transfer_manager.update_transfer_status(
                         self.transfer_id, TransferStatus.ERROR, str(e)
                     )
+        finally:
+            self._clients.close_all()
 
     def cancel(self) -> None:
         """Annule l'upload du dossier"""
-        with QMutexLocker(self.cancelled_mutex):
-            self.is_cancelled = True
+        self.is_cancelled = True
 
         if self.transfer_manager and self.transfer_id:
             self.transfer_manager.update_transfer_status(
@@ -724,7 +1163,8 @@ class RetryUploadThread(QThread):
     status_signal = pyqtSignal(str)
 
     def __init__(self, drive_client: GoogleDriveClient, transfer, retry_files: List, 
-                 transfer_manager: Optional[TransferManager] = None):
+                 transfer_manager: Optional[TransferManager] = None,
+                 max_parallel_uploads: int = 8):
         """
         Initialise le thread de retry
 
@@ -733,16 +1173,30 @@ class RetryUploadThread(QThread):
             transfer: TransferItem parent
             retry_files: Liste des FileTransferItem à réessayer
             transfer_manager: Gestionnaire de transferts
+            max_parallel_uploads: Nombre maximum de retries simultanés
         """
         super().__init__()
         self.drive_client = drive_client
         self.transfer = transfer
         self.retry_files = retry_files
         self.transfer_manager = transfer_manager
+        self.max_parallel_uploads = max(1, min(max_parallel_uploads, 10))
         self.is_cancelled = False
         self.total_files = len(retry_files)
         self.completed_files = 0
 
+        # Statuts de fichiers appliqués par lots par un thread dédié
+        self._file_statuses = TransferStatusWriter(transfer_manager) if transfer_manager else None
+
+        # Un client réutilisé par thread du pool (connexion keep-alive)
+        self._clients = ThreadLocalDriveClients()
+
+    def _queue_file_status(self, file_item, status: TransferStatus, error_message: str = "") -> None:
+        """Met en file une mise à jour de statut de fichier pour le TransferManager"""
+        if self._file_statuses:
+            self._file_statuses.put(self.transfer.transfer_id, file_item.file_path, status,
+                                    0, error_message)
+
     def run(self) -> None:
         """Exécute le retry des fichiers échoués"""
         if not self.retry_files:
@@ -752,60 +1206,47 @@ class RetryUploadThread(QThread):
         self.status_signal.emit(f"🔄 Retry de {self.total_files} fichier(s)...")
 
         try:
-            # Construire le mapping des dossiers existants
-            folder_mapping = self._rebuild_folder_mapping()
+            # Dossier parent de chaque fichier, dans l'ordre de retry_files
+            parent_of = self._rebuild_folder_mapping()
 
-            for i, file_item in enumerate(self.retry_files):
-                if self.is_cancelled:
-                    break
+            if self._file_statuses:
+                self._file_statuses.start()
 
-                try:
-                    # Déterminer le dossier parent
-                    parent_id = folder_mapping.get(file_item.relative_path, self.transfer.destination_folder_id)
-                    if not parent_id:
-                        parent_id = self.transfer.destination_folder_id
-
-                    self.status_signal.emit(f"🔄 Retry: {file_item.file_name}")
-
-                    # Vérifier si le fichier existe déjà
-                    if already_exists_in_folder(SafeGoogleDriveUploader.get_fresh_client(), parent_id, file_item.file_name):
-                        # Marquer comme complété
-                        if self.transfer_manager:
-                            self.transfer_manager.update_file_status_in_transfer(
-                                self.transfer.transfer_id, file_item.file_path, TransferStatus.COMPLETED
-                            )
-                        file_item.exists_on_drive = True
-                        self.status_signal.emit(f"⏭️ Ignoré (existe): {file_item.file_name}")
-                    else:
-                        # Upload du fichier
-                        file_id = SafeGoogleDriveUploader.safe_upload_file(
-                            file_item.file_path, parent_id, False  # Assume non-shared drive
-                        )
+            inflight = set()
+            try:
+                # Listings des dossiers parents regroupés en requêtes batch: les
+                # vérifications d'existence sont ensuite résolues depuis le cache
+                prefetch_folder_listings(self._clients.get(), parent_of)
 
-                        # Marquer comme réussi
-                        if self.transfer_manager:
-                            self.transfer_manager.update_file_status_in_transfer(
-                                self.transfer.transfer_id, file_item.file_path, TransferStatus.COMPLETED
-                            )
-                        file_item.uploaded_file_id = file_id
-                        file_item.destination_folder_id = parent_id
-                        self.status_signal.emit(f"✅ Retry réussi: {file_item.file_name}")
+                # Fenêtre glissante sur le pool partagé: au plus max_parallel_uploads en vol
+                pending_files = zip(self.retry_files, parent_of)
+                while True:
+                    if not self.is_cancelled:
+                        for file_item, parent_id in pending_files:
+                            inflight.add(_TRANSFER_POOL.submit(self._retry_one, file_item, parent_id))
+                            if len(inflight) >= self.max_parallel_uploads:
+                                break
 
-                    self.completed_files += 1
-                    progress = int((self.completed_files / self.total_files) * 100)
-                    self.progress_signal.emit(progress)
+                    if not inflight:
+                        break
 
-                except Exception as e:
-                    # Maintenir l'erreur
-                    if self.transfer_manager:
-                        self.transfer_manager.update_file_status_in_transfer(
-                            self.transfer.transfer_id, file_item.file_path, TransferStatus.ERROR, 0, str(e)
-                        )
-                    self.status_signal.emit(f"❌ Retry échoué: {file_item.file_name}")
-                    self.error_signal.emit(f"Retry échoué pour {file_item.file_name}: {str(e)}")
+                    done, inflight = wait(inflight, timeout=1.0, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        if future.result():
+                            self.completed_files += 1
+                            progress = int((self.completed_files / self.total_files) * 100)
+                            self.progress_signal.emit(progress)
 
-                # Petit délai entre les fichiers
-                time.sleep(0.1)
+                    if self.is_cancelled:
+                        break
+            finally:
+                # Annuler les tâches pas encore démarrées, attendre celles en cours
+                for future in inflight:
+                    future.cancel()
+                wait(inflight)
+                self._clients.close_all()
+                if self._file_statuses:
+                    self._file_statuses.stop()
 
             if not self.is_cancelled:
                 self.status_signal.emit(f"🎉 Retry terminé: {self.completed_files}/{self.total_files}")
@@ -814,8 +1255,60 @@ class RetryUploadThread(QThread):
         except Exception as e:
             self.error_signal.emit(f"Erreur durant le retry: {str(e)}")
 
-    def _rebuild_folder_mapping(self) -> Dict[str, str]:
-        """Reconstruit le mapping des dossiers pour les fichiers en retry"""
+    def _retry_one(self, file_item, parent_id: str) -> bool:
+        """
+        Réessaie l'upload d'un seul fichier
+
+        Args:
+            file_item: FileTransferItem à réessayer
+            parent_id: ID du dossier Drive de destination
+
+        Returns:
+            True si le fichier est désormais sur Drive, False sinon
+        """
+        if self.is_cancelled:
+            return False
+
+        file_name = file_item.file_name
+        try:
+            self.status_signal.emit(f"🔄 Retry: {file_name}")
+            client = self._clients.get()
+
+            # Vérifier si le fichier existe déjà (listing du dossier préchargé)
+            if already_exists_in_folder(client, parent_id, file_name):
+                # Marquer comme complété
+                self._queue_file_status(file_item, TransferStatus.COMPLETED)
+                file_item.exists_on_drive = True
+                self.status_signal.emit(f"⏭️ Ignoré (existe): {file_name}")
+            else:
+                # Upload du fichier
+                file_id = SafeGoogleDriveUploader.safe_upload_file(
+                    file_item.file_path, parent_id, False,  # Assume non-shared drive
+                    drive_client=client
+                )
+
+                # Marquer comme réussi
+                self._queue_file_status(file_item, TransferStatus.COMPLETED)
+                file_item.uploaded_file_id = file_id
+                file_item.destination_folder_id = parent_id
+                self.status_signal.emit(f"✅ Retry réussi: {file_name}")
+
+            return True
+
+        except Exception as e:
+            # Maintenir l'erreur
+            self._queue_file_status(file_item, TransferStatus.ERROR, str(e))
+            self.status_signal.emit(f"❌ Retry échoué: {file_name}")
+            self.error_signal.emit(f"Retry échoué pour {file_name}: {str(e)}")
+            return False
+
+    def _rebuild_folder_mapping(self) -> List[str]:
+        """
+        Reconstruit le mapping des dossiers pour les fichiers en retry
+
+        Returns:
+            ID du dossier parent Drive de chaque fichier, dans l'ordre de retry_files
+        """
         # Pour l'instant, utiliser des valeurs par défaut
         # Dans une implémentation plus avancée, on pourrait sauvegarder et restaurer le mapping
         folder_mapping = {'': self.transfer.destination_folder_id}
@@ -825,7 +1318,9 @@ class RetryUploadThread(QThread):
             if file_item.destination_folder_id:
                 folder_mapping[file_item.relative_path] = file_item.destination_folder_id
 
-        return folder_mapping
+        default_parent_id = self.transfer.destination_folder_id
+        return [folder_mapping.get(file_item.relative_path) or default_parent_id
+                for file_item in self.retry_files]
 
     def cancel(self) -> None:
         """Annule le retry"""
@@ -869,6 +1364,20 @@ class DownloadThread(QThread):
         self.is_cancelled = False
         self.start_time = 0
 
+        # Progrès coalescé: le thread de téléchargement ne fait qu'enregistrer la
+        # dernière valeur, un timer du thread principal l'émet au plus 10 fois/s
+        self._pending_progress = -1
+        self._last_emitted_progress = -1
+        # Passe à True juste avant completed_signal/error_signal: plus aucun progrès
+        # partiel ne doit être émis après l'état final
+        self._progress_final = False
+        self._progress_lock = threading.Lock()
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(100)
+        self._progress_timer.timeout.connect(self._flush_progress)
+        self.started.connect(self._progress_timer.start)
+        self.finished.connect(self._stop_progress_timer)
+
     def run(self) -> None:
         """Exécute le téléchargement sécurisé"""
         self.start_time = time.time()
@@ -887,10 +1396,17 @@ class DownloadThread(QThread):
             # Téléchargement avec retry
             for attempt in range(3):
                 try:
-                    file_path = self.drive_client.download_file(
-                        self.file_id, self.file_name, self.local_dir, self.progress_callback
-                    )
+                    if self.file_size > PARALLEL_DOWNLOAD_THRESHOLD:
+                        # Gros fichier: parties téléchargées en parallèle
+                        file_path = self.drive_client.download_file_parallel(
+                            self.file_id, self.file_name, self.local_dir, self.progress_callback
+                        )
+                    else:
+                        file_path = self.drive_client.download_file(
+                            self.file_id, self.file_name, self.local_dir, self.progress_callback
+                        )
 
+                    self._finish_progress()
                     if not self.is_cancelled:
                         self.completed_signal.emit(file_path)
                         if self.transfer_manager and self.transfer_id:
@@ -911,6 +1427,7 @@ class DownloadThread(QThread):
                         raise e
 
         except Exception as e:
+            self._finish_progress()
             if not self.is_cancelled:
                 self.error_signal.emit(str(e))
                 if self.transfer_manager and self.transfer_id:
@@ -919,15 +1436,38 @@ class DownloadThread(QThread):
                     )
 
     def progress_callback(self, progress: int) -> None:
-        """Callback sécurisé pour le progrès"""
-        if self.is_cancelled:
+        """Callback sécurisé pour le progrès (la dernière valeur l'emporte)"""
+        self._pending_progress = progress
+
+    def _flush_progress(self) -> None:
+        """Émet le dernier progrès enregistré s'il a changé (thread principal)"""
+        with self._progress_lock:
+            if not self._progress_final:
+                self._emit_pending_progress()
+
+    def _finish_progress(self) -> None:
+        """
+        Émet le dernier progrès puis bloque les émissions suivantes
+
+        Appelé par le thread de téléchargement avant completed_signal/error_signal:
+        le progrès, émis depuis le même thread, arrive avant l'état final.
+        """
+        with self._progress_lock:
+            if not self._progress_final:
+                self._emit_pending_progress()
+                self._progress_final = True
+
+    def _emit_pending_progress(self) -> None:
+        """Émet le progrès en attente s'il a changé (appelé sous _progress_lock)"""
+        progress = self._pending_progress
+        if self.is_cancelled or progress == self._last_emitted_progress:
             return
+        self._last_emitted_progress = progress
 
         self.progress_signal.emit(progress)
 
         if self.transfer_manager and self.transfer_id and self.file_size > 0:
-            current_time = time.time()
-            elapsed_time = current_time - self.start_time
+            elapsed_time = time.time() - self.start_time
 
             if elapsed_time > 0:
                 bytes_transferred = int((progress / 100.0) * self.file_size)
@@ -937,6 +1477,10 @@ class DownloadThread(QThread):
                     self.transfer_id, progress, bytes_transferred, speed
                 )
 
+    def _stop_progress_timer(self) -> None:
+        """Arrête le timer de progrès (le dernier progrès a été émis par run)"""
+        self._progress_timer.stop()
+
     def cancel(self) -> None:
         """Annule le téléchargement"""
         self.is_cancelled = True
@@ -7,6 +7,7 @@ from .helpers import (
     get_file_emoji,
     get_file_type_description,
     format_date,
+    file_category,
     is_image_file,
     is_document_file,
     is_audio_file,
@@ -25,6 +26,7 @@ __all__ = [
     'get_file_emoji',
     'get_file_type_description',
     'format_date',
+    'file_category',
     'is_image_file',
     'is_document_file',
     'is_audio_file',
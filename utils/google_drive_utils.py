@@ -2,102 +2,326 @@
 Utilitaires Google Drive avec détection de doublons corrigée
 """
 
+import sys
 import time
+import random
+import logging
 import threading
-from typing import Dict, Set, Optional, Tuple
+from enum import IntEnum
+from typing import Dict, Set, Optional, Tuple, Iterable
+from config.settings import (DRIVE_BATCH_MAX_REQUESTS, DRIVE_API_MAX_CONCURRENCY,
+                             EXISTS_CACHE_TTL, EXISTS_CACHE_MAX_SIZE,
+                             FOLDER_LISTING_CACHE_TTL, FOLDER_LISTING_CACHE_MAX_FOLDERS)
+from googleapiclient.errors import HttpError
 from core.google_drive_client import GoogleDriveClient
 
+logger = logging.getLogger(__name__)
+
+# Limite les requêtes de listing/existence en vol: au-delà, Drive répond en 429
+# et les retries de tous les workers aggravent la situation
+_drive_call_slots = threading.BoundedSemaphore(DRIVE_API_MAX_CONCURRENCY)
+
+
+def set_drive_concurrency(max_calls: int) -> None:
+    """
+    Modifie le nombre maximum de requêtes Drive simultanées de ce module
+
+    Les requêtes déjà en cours terminent avec l'ancienne limite.
+
+    Args:
+        max_calls: Nombre maximum de requêtes en vol (au moins 1)
+    """
+    global _drive_call_slots
+    _drive_call_slots = threading.BoundedSemaphore(max(1, max_calls))
+
+
+# Paramètres fixes de la requête de vérification d'existence par nom
+_EXISTS_LIST_KWARGS = {
+    'pageSize': 1,  # On a juste besoin de savoir si ça existe
+    'fields': "files(id)",
+    'supportsAllDrives': True,
+    'includeItemsFromAllDrives': True,
+}
+
+
+def _escape_query_value(value: str) -> str:
+    """Échappe une valeur pour une chaîne entre apostrophes d'une requête Drive (q=)"""
+    return value.replace("\\", "\\\\").replace("'", "\\'")
+
+
+# Réponses récentes de already_exists_in_folder: (parent_id, nom) -> (expiration, existe)
+_exists_cache: Dict[Tuple[str, str], Tuple[float, bool]] = {}
+_exists_cache_lock = threading.Lock()
+
+
+def _get_cached_exists(key: Tuple[str, str]) -> Optional[bool]:
+    """Retourne la réponse en cache pour (parent_id, nom), ou None si absente ou expirée"""
+    with _exists_cache_lock:
+        entry = _exists_cache.get(key)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            del _exists_cache[key]
+            return None
+        return entry[1]
+
+
+def _set_cached_exists(key: Tuple[str, str], exists: bool) -> None:
+    """Mémorise une réponse pour EXISTS_CACHE_TTL secondes"""
+    now = time.monotonic()
+    with _exists_cache_lock:
+        if len(_exists_cache) >= EXISTS_CACHE_MAX_SIZE:
+            # Purger les entrées expirées, puis tout si le cache reste plein
+            for expired in [k for k, (expires, _) in _exists_cache.items() if expires < now]:
+                del _exists_cache[expired]
+            if len(_exists_cache) >= EXISTS_CACHE_MAX_SIZE:
+                _exists_cache.clear()
+        _exists_cache[key] = (now + EXISTS_CACHE_TTL, exists)
+
+
+# Noms présents par dossier: parent_id -> (expiration, noms)
+_folder_listing_cache: Dict[str, Tuple[float, Set[str]]] = {}
+_folder_listing_lock = threading.Lock()
+# Un verrou par dossier en cours de listing: les autres workers l'attendent au lieu de relister
+_folder_fetch_locks: Dict[str, threading.Lock] = {}
+
+
+def _get_cached_listing(parent_id: str) -> Optional[Set[str]]:
+    """Retourne les noms en cache d'un dossier, ou None si absents ou expirés"""
+    with _folder_listing_lock:
+        entry = _folder_listing_cache.get(parent_id)
+        if entry is None or entry[0] < time.monotonic():
+            return None
+        return entry[1]
+
+
+def _get_folder_listing(drive_client: GoogleDriveClient, parent_id: str) -> Optional[Set[str]]:
+    """
+    Retourne les noms présents dans un dossier, listé au plus une fois par FOLDER_LISTING_CACHE_TTL
+
+    Args:
+        drive_client: Client Google Drive
+        parent_id: ID du dossier parent
+
+    Returns:
+        Ensemble des noms du dossier, ou None si le listing a échoué
+    """
+    names = _get_cached_listing(parent_id)
+    if names is not None:
+        return names
+
+    with _folder_listing_lock:
+        fetch_lock = _folder_fetch_locks.setdefault(parent_id, threading.Lock())
+
+    with fetch_lock:
+        # Un autre worker a pu lister le dossier pendant l'attente
+        names = _get_cached_listing(parent_id)
+        if names is not None:
+            return names
+
+        try:
+            names = list_file_names_in_folder(drive_client, parent_id)
+            _store_listing(parent_id, names)
+            return names
+        except Exception as e:
+            logger.warning("Listing du dossier %s impossible: %s", parent_id, e)
+            return None
+        finally:
+            # Verrou retiré une fois le listing en cache: un verrou par dossier en cours
+            # de listing, pas par dossier déjà listé. Les workers qui l'attendent le gardent
+            with _folder_listing_lock:
+                if _folder_fetch_locks.get(parent_id) is fetch_lock:
+                    del _folder_fetch_locks[parent_id]
+
+
+def _store_listing(parent_id: str, names: Set[str]) -> None:
+    """Met en cache les noms d'un dossier pour FOLDER_LISTING_CACHE_TTL secondes"""
+    now = time.monotonic()
+    with _folder_listing_lock:
+        if len(_folder_listing_cache) >= FOLDER_LISTING_CACHE_MAX_FOLDERS:
+            for expired in [k for k, (expires, _) in _folder_listing_cache.items() if expires < now]:
+                del _folder_listing_cache[expired]
+            if len(_folder_listing_cache) >= FOLDER_LISTING_CACHE_MAX_FOLDERS:
+                _folder_listing_cache.clear()
+        _folder_listing_cache[parent_id] = (now + FOLDER_LISTING_CACHE_TTL, names)
+
+
+def prefetch_folder_listings(drive_client: GoogleDriveClient, parent_ids: Iterable[str]) -> None:
+    """
+    Liste d'avance plusieurs dossiers via des requêtes batch et met les résultats en cache
+
+    Les appels suivants à already_exists_in_folder pour ces dossiers sont
+    résolus en mémoire: les vérifications d'un lot de fichiers répartis sur
+    N dossiers coûtent N/100 allers-retours au lieu d'un par dossier.
+
+    Args:
+        drive_client: Client Google Drive
+        parent_ids: IDs des dossiers parents
+    """
+    missing = [parent_id for parent_id in dict.fromkeys(parent_ids)
+               if _get_cached_listing(parent_id) is None]
+    if not missing:
+        return
+
+    for parent_id, names in list_file_names_in_folders(drive_client, missing).items():
+        # Dossier en échec: il sera listé individuellement au premier besoin
+        if names is not None:
+            _store_listing(parent_id, names)
+
+
+def remember_uploaded(parent_id: str, name: str) -> None:
+    """
+    Signale qu'un fichier vient d'être uploadé dans un dossier
+
+    Les vérifications d'existence suivantes le voient immédiatement, sans
+    attendre l'expiration d'une réponse négative en cache.
+
+    Args:
+        parent_id: ID du dossier parent
+        name: Nom du fichier uploadé
+    """
+    _set_cached_exists((parent_id, name), True)
+    with _folder_listing_lock:
+        entry = _folder_listing_cache.get(parent_id)
+        if entry is not None:
+            entry[1].add(name)
+
+
+class TrackedFileStatus(IntEnum):
+    """État d'un fichier suivi par le DuplicateTracker"""
+    UPLOADING = 0  # Revendiqué, valeur associée: worker_id
+    UPLOADED = 1   # Uploadé dans cette session, valeur associée: file_id
+
+
+class _TrackerShard:
+    """Partie du tracker protégée par son propre verrou"""
+
+    __slots__ = ('lock', 'files')
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # (folder_id, filename) -> (UPLOADING, worker_id) ou (UPLOADED, file_id)
+        self.files: Dict[Tuple[str, str], Tuple[TrackedFileStatus, str]] = {}
+
 
 class DuplicateTracker:
     """
     Tracker global pour éviter les doublons pendant les uploads concurrents
+
+    Les clés (folder_id, filename) sont réparties sur plusieurs shards ayant
+    chacun leur verrou: des workers traitant des fichiers différents ne se
+    bloquent pas entre eux. Chaque fichier n'a qu'une entrée, dont l'état
+    passe de UPLOADING à UPLOADED.
     """
 
+    SHARD_COUNT = 16
+
     def __init__(self):
-        self._lock = threading.RLock()
-        # Track files being uploaded: (folder_id, filename) -> worker_id
-        self._uploading_files: Dict[Tuple[str, str], str] = {}
-        # Track completed uploads in THIS SESSION: (folder_id, filename) -> file_id
-        self._uploaded_files: Dict[Tuple[str, str], str] = {}
+        self._shards = [_TrackerShard() for _ in range(self.SHARD_COUNT)]
+
+    @staticmethod
+    def _key(folder_id: str, filename: str) -> Tuple[str, str]:
+        """Clé d'un fichier, ID de dossier interné: une seule copie partagée par toutes les clés"""
+        return (sys.intern(folder_id), filename)
+
+    def _shard(self, key: Tuple[str, str]) -> _TrackerShard:
+        """Retourne le shard responsable d'une clé"""
+        return self._shards[(hash(key) & 0x7fffffff) % len(self._shards)]
 
     def claim_file(self, folder_id: str, filename: str, worker_id: str) -> bool:
         """
         Revendique un fichier pour upload. Retourne True si le claim réussit.
         """
-        with self._lock:
-            key = (folder_id, filename)
-
-            # Vérifier si déjà uploadé DANS CETTE SESSION
-            if key in self._uploaded_files:
-                print(f"🔍 File {filename} already uploaded in this session")
-                return False
-
-            # Vérifier si déjà en cours d'upload
-            if key in self._uploading_files:
-                print(f"🔍 File {filename} already being uploaded by {self._uploading_files[key]}")
-                return False
-
-            # Revendiquer le fichier
-            self._uploading_files[key] = worker_id
-            print(f"✅ File {filename} claimed by {worker_id}")
+        key = self._key(folder_id, filename)
+        shard = self._shard(key)
+        # Journalisation faite après avoir relâché le verrou
+        with shard.lock:
+            entry = shard.files.get(key)
+            if entry is None:
+                # Revendiquer le fichier
+                shard.files[key] = (TrackedFileStatus.UPLOADING, worker_id)
+
+        if entry is None:
+            logger.debug("File %s claimed by %s", filename, worker_id)
             return True
+        if entry[0] == TrackedFileStatus.UPLOADED:
+            # Déjà uploadé DANS CETTE SESSION
+            logger.debug("File %s already uploaded in this session", filename)
+        else:
+            # Déjà en cours d'upload
+            logger.debug("File %s already being uploaded by %s", filename, entry[1])
+        return False
 
     def mark_uploaded(self, folder_id: str, filename: str, file_id: str, worker_id: str):
         """
         Marque un fichier comme uploadé avec succès
         """
-        with self._lock:
-            key = (folder_id, filename)
-
+        key = self._key(folder_id, filename)
+        shard = self._shard(key)
+        with shard.lock:
             # Vérifier que c'est bien le worker qui a claim le fichier
-            if self._uploading_files.get(key) == worker_id:
-                # Déplacer vers les fichiers uploadés
-                del self._uploading_files[key]
-                self._uploaded_files[key] = file_id
-                print(f"📝 File {filename} marked as uploaded by {worker_id}")
+            if shard.files.get(key) != (TrackedFileStatus.UPLOADING, worker_id):
+                return
+            shard.files[key] = (TrackedFileStatus.UPLOADED, file_id)
+        remember_uploaded(folder_id, filename)
+        logger.debug("File %s marked as uploaded by %s", filename, worker_id)
 
     def release_file(self, folder_id: str, filename: str, worker_id: str):
         """
         Libère un fichier en cas d'échec d'upload
         """
-        with self._lock:
-            key = (folder_id, filename)
-
+        key = self._key(folder_id, filename)
+        shard = self._shard(key)
+        with shard.lock:
             # Vérifier que c'est bien le worker qui a claim le fichier
-            if self._uploading_files.get(key) == worker_id:
-                del self._uploading_files[key]
-                print(f"🔓 File {filename} released by {worker_id}")
+            if shard.files.get(key) != (TrackedFileStatus.UPLOADING, worker_id):
+                return
+            del shard.files[key]
+        logger.debug("File %s released by %s", filename, worker_id)
+
+    def _status_of(self, folder_id: str, filename: str) -> Optional[TrackedFileStatus]:
+        """Retourne l'état d'un fichier, ou None s'il n'est pas suivi"""
+        key = self._key(folder_id, filename)
+        shard = self._shard(key)
+        with shard.lock:
+            entry = shard.files.get(key)
+        return entry[0] if entry is not None else None
 
     def is_uploaded_in_session(self, folder_id: str, filename: str) -> bool:
         """
         Vérifie si un fichier a déjà été uploadé dans cette session
         """
-        with self._lock:
-            return (folder_id, filename) in self._uploaded_files
+        return self._status_of(folder_id, filename) == TrackedFileStatus.UPLOADED
 
     def is_being_uploaded(self, folder_id: str, filename: str) -> bool:
         """
         Vérifie si un fichier est en cours d'upload
         """
-        with self._lock:
-            return (folder_id, filename) in self._uploading_files
+        return self._status_of(folder_id, filename) == TrackedFileStatus.UPLOADING
 
     def clear_all(self):
         """
         Nettoie tout le tracking
         """
-        with self._lock:
-            self._uploaded_files.clear()
-            self._uploading_files.clear()
-            print("🧹 All duplicate tracking cleared")
+        for shard in self._shards:
+            with shard.lock:
+                shard.files.clear()
+        logger.debug("All duplicate tracking cleared")
 
     def get_stats(self) -> Dict[str, int]:
         """Retourne les statistiques"""
-        with self._lock:
-            return {
-                'uploaded_files': len(self._uploaded_files),
-                'uploading_files': len(self._uploading_files)
-            }
+        uploaded_files = 0
+        uploading_files = 0
+        for shard in self._shards:
+            with shard.lock:
+                statuses = [status for status, _ in shard.files.values()]
+            uploaded = statuses.count(TrackedFileStatus.UPLOADED)
+            uploaded_files += uploaded
+            uploading_files += len(statuses) - uploaded
+        return {
+            'uploaded_files': uploaded_files,
+            'uploading_files': uploading_files
+        }
 
 
 # Instance globale du tracker
@@ -110,11 +334,18 @@ def get_duplicate_tracker() -> DuplicateTracker:
 
 def already_exists_in_folder(drive_client: GoogleDriveClient, parent_id: str, name: str,
                            mime_type: Optional[str] = None, size: Optional[int] = None,
-                           max_retries: int = 2, retry_delay: float = 0.5) -> bool:
+                           max_retries: int = 4, retry_delay: float = 0.5,
+                           use_cache: bool = True) -> bool:
     """
     Vérifie si un fichier/dossier avec le même nom existe dans le dossier cible.
     Version corrigée qui ne pollue pas le tracker.
 
+    Le contenu du dossier est listé une seule fois puis gardé en cache
+    (FOLDER_LISTING_CACHE_TTL): les vérifications suivantes dans le même dossier
+    ne coûtent qu'une recherche en mémoire. La requête par nom ne sert plus
+    qu'en cas d'échec du listing, ou avec use_cache=False pour interroger Drive
+    directement.
+
     Args:
         drive_client: Client Google Drive
         parent_id: ID du dossier parent
@@ -122,71 +353,198 @@ def already_exists_in_folder(drive_client: GoogleDriveClient, parent_id: str, na
         mime_type: Type MIME (optionnel, pour compatibilité)
         size: Taille (optionnelle, pour compatibilité)
         max_retries: Nombre maximum de tentatives
-        retry_delay: Délai entre les tentatives
+        retry_delay: Délai de base entre les tentatives (doublé à chaque tentative)
+        use_cache: False pour ignorer les réponses en cache, ex: re-vérification
+            après un échec d'upload que le serveur a pu valider malgré tout
 
     Returns:
         True si le fichier existe déjà SUR GOOGLE DRIVE (pas dans le tracker)
+
+    Raises:
+        HttpError: Si Drive limite encore le débit après toutes les tentatives
     """
 
-    print(f"🔍 Checking if '{name}' exists in folder {parent_id}")
+    # Réponse récente pour le même dossier et le même nom
+    cache_key = (parent_id, name)
+    cached = _get_cached_exists(cache_key) if use_cache else None
+    if cached is not None:
+        return cached
+
+    # Un seul listing par dossier répond à toutes les vérifications de ses fichiers
+    if use_cache:
+        folder_names = _get_folder_listing(drive_client, parent_id)
+        if folder_names is not None:
+            return name in folder_names
+
+    logger.debug("Checking if '%s' exists in folder %s", name, parent_id)
 
     # Vérifier sur Google Drive avec retry
+    # Nom échappé: une apostrophe ne casse plus la requête (et ne force plus le fallback)
+    query = f"'{parent_id}' in parents and name = '{_escape_query_value(name)}' and trashed = false"
     for attempt in range(max_retries):
         try:
             # Utiliser une requête de recherche précise
-            query = f"'{parent_id}' in parents and name = '{name}' and trashed = false"
-
+            with _drive_call_slots:
+                results = drive_client.service.files().list(q=query, **_EXISTS_LIST_KWARGS).execute()
+
+            # Le filtre name = '...' (nom échappé) est exact côté serveur
+            files = results.get('files', [])
+            if files:
+                logger.debug("File '%s' already exists on Drive (ID: %s)", name, files[0]['id'])
+                # Aussi ajouté au listing en cache, qui peut dater d'avant ce fichier
+                remember_uploaded(parent_id, name)
+                return True
+
+            logger.debug("File '%s' does not exist on Drive", name)
+            _set_cached_exists(cache_key, False)
+            return False
+
+        except Exception as api_error:
+            logger.warning("API error checking file existence (attempt %d): %s", attempt + 1, api_error)
+
+            if attempt < max_retries - 1:
+                # Backoff exponentiel avec jitter: les workers ne réessaient pas en même temps
+                time.sleep(retry_delay * (2 ** attempt) + random.uniform(0, retry_delay))
+                continue
+
+            # Limitation de débit persistante: remonter l'erreur pour que l'appelant
+            # ralentisse, plutôt que d'ajouter une requête de fallback
+            if _is_rate_limit_error(api_error):
+                raise
+
+            # Dernière tentative: fallback avec list_files
+            logger.info("Fallback: Using list_files for folder %s", parent_id)
             try:
-                results = drive_client.service.files().list(
-                    q=query,
-                    pageSize=5,  # On a juste besoin de savoir si ça existe
-                    fields="files(id, name)",
-                    supportsAllDrives=True,
-                    includeItemsFromAllDrives=True
-                ).execute()
-
-                files = results.get('files', [])
-
-                if files:
-                    # Fichier trouvé, vérifier plus précisément
-                    for file in files:
-                        if file['name'] == name:  # Double vérification
-                            print(f"✅ File '{name}' already exists on Drive (ID: {file['id']})")
-                            return True
-
-                print(f"❌ File '{name}' does not exist on Drive")
+                with _drive_call_slots:
+                    files = drive_client.list_files(parent_id)
+                for file in files:
+                    if file['name'] == name:
+                        logger.debug("File '%s' found via fallback", name)
+                        return True
+                logger.debug("File '%s' not found via fallback", name)
                 return False
+            except Exception as fallback_error:
+                logger.warning("Fallback also failed: %s", fallback_error)
+                # En cas d'échec total, on assume que le fichier n'existe pas
+                # (mieux vaut un doublon qu'un fichier non uploadé)
+                return False
+
+    return False
+
 
-            except Exception as api_error:
-                print(f"⚠️ API error checking file existence (attempt {attempt + 1}): {api_error}")
-
-                # Si c'est la dernière tentative, faire un fallback avec list_files
-                if attempt == max_retries - 1:
-                    print(f"🔄 Fallback: Using list_files for folder {parent_id}")
-                    try:
-                        files = drive_client.list_files(parent_id)
-                        for file in files:
-                            if file['name'] == name:
-                                print(f"✅ File '{name}' found via fallback")
-                                return True
-                        print(f"❌ File '{name}' not found via fallback")
-                        return False
-                    except Exception as fallback_error:
-                        print(f"❌ Fallback also failed: {fallback_error}")
-                        # En cas d'échec total, on assume que le fichier n'existe pas
-                        # (mieux vaut un doublon qu'un fichier non uploadé)
-                        return False
-                else:
-                    # Attendre avant la prochaine tentative
-                    time.sleep(retry_delay)
+def _is_rate_limit_error(error: Exception) -> bool:
+    """
+    Indique si une erreur de l'API Drive est une limitation de débit
+
+    Args:
+        error: Exception levée par une requête
 
+    Returns:
+        True pour les HttpError 429 et les 403 rateLimitExceeded/userRateLimitExceeded
+    """
+    if not isinstance(error, HttpError):
+        return False
+    status = error.resp.status
+    return status == 429 or (status == 403 and 'ratelimitexceeded' in str(error).lower())
+
+
+def list_file_names_in_folder(drive_client: GoogleDriveClient, parent_id: str) -> Set[str]:
+    """
+    Liste les noms de tous les éléments d'un dossier en une requête paginée.
+
+    Permet de remplacer plusieurs appels à already_exists_in_folder sur un même
+    dossier par des recherches en mémoire.
+
+    Args:
+        drive_client: Client Google Drive
+        parent_id: ID du dossier parent
+
+    Returns:
+        Ensemble des noms présents dans le dossier (hors corbeille)
+    """
+    names = set()
+    page_token = None
+    while True:
+        with _drive_call_slots:
+            results = drive_client.service.files().list(
+                q=f"'{parent_id}' in parents and trashed = false",
+                pageSize=1000,
+                pageToken=page_token,
+                fields="nextPageToken, files(name)",
+                supportsAllDrives=True,
+                includeItemsFromAllDrives=True
+            ).execute()
+        names.update(file['name'] for file in results.get('files', []))
+        page_token = results.get('nextPageToken')
+        if not page_token:
+            return names
+
+
+def list_file_names_in_folders(drive_client: GoogleDriveClient,
+                               parent_ids: Iterable[str]) -> Dict[str, Optional[Set[str]]]:
+    """
+    Liste les noms des éléments de plusieurs dossiers via des requêtes batch.
+
+    La première page de chaque dossier est demandée dans un batch HTTP (jusqu'à
+    100 dossiers par aller-retour); seules les pages suivantes, rares, sont
+    récupérées individuellement.
+
+    Args:
+        drive_client: Client Google Drive
+        parent_ids: IDs des dossiers parents
+
+    Returns:
+        Noms présents par dossier (None si le listing du dossier a échoué)
+    """
+    parent_ids = list(dict.fromkeys(parent_ids))
+    names_by_parent: Dict[str, Optional[Set[str]]] = {}
+    next_pages: Dict[str, str] = {}
+
+    def list_request(parent_id: str, page_token: Optional[str] = None):
+        return drive_client.service.files().list(
+            q=f"'{parent_id}' in parents and trashed = false",
+            pageSize=1000,
+            pageToken=page_token,
+            fields="nextPageToken, files(name)",
+            supportsAllDrives=True,
+            includeItemsFromAllDrives=True
+        )
+
+    def on_response(request_id, response, exception):
+        parent_id = parent_ids[int(request_id)]
+        if exception is not None:
+            logger.warning("Listing du dossier %s impossible: %s", parent_id, exception)
+            names_by_parent[parent_id] = None
+            return
+        names_by_parent[parent_id] = {file['name'] for file in response.get('files', [])}
+        if response.get('nextPageToken'):
+            next_pages[parent_id] = response['nextPageToken']
+
+    for start in range(0, len(parent_ids), DRIVE_BATCH_MAX_REQUESTS):
+        batch = drive_client.service.new_batch_http_request(callback=on_response)
+        for index in range(start, min(start + DRIVE_BATCH_MAX_REQUESTS, len(parent_ids))):
+            batch.add(list_request(parent_ids[index]), request_id=str(index))
+        try:
+            with _drive_call_slots:
+                batch.execute()
         except Exception as e:
-            print(f"⚠️ Unexpected error checking file existence: {e}")
-            if attempt == max_retries - 1:
-                return False
-            time.sleep(retry_delay)
+            logger.warning("Listing batch des dossiers impossible: %s", e)
 
-    return False
+    # Pages suivantes des dossiers volumineux
+    for parent_id, page_token in next_pages.items():
+        try:
+            while page_token:
+                with _drive_call_slots:
+                    results = list_request(parent_id, page_token).execute()
+                names_by_parent[parent_id].update(file['name'] for file in results.get('files', []))
+                page_token = results.get('nextPageToken')
+        except Exception as e:
+            logger.warning("Listing du dossier %s impossible: %s", parent_id, e)
+            names_by_parent[parent_id] = None
+
+    for parent_id in parent_ids:
+        names_by_parent.setdefault(parent_id, None)
+    return names_by_parent
 
 
 def clear_duplicate_tracking():
@@ -3,11 +3,73 @@ Fonctions utilitaires pour l'application Google Drive Explorer
 """
 
 import os
+import re
+import math
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
 from config.settings import FILE_EMOJIS, FILE_TYPES
 
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+# Date et heure (jusqu'aux minutes) d'un horodatage Google Drive "2023-12-25T10:30:45.123Z"
+_DRIVE_TS_RE = re.compile(r"^(\d{4}-\d{2}-\d{2})T(\d{2}:\d{2})")
+
+# Caractères interdits dans un nom de fichier (Windows et autres systèmes) -> '_'
+_SANITIZE_TABLE = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
+
+# Noms réservés sur Windows
+_RESERVED_NAMES = frozenset({
+    'CON', 'PRN', 'AUX', 'NUL',
+    'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
+    'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'
+})
+
+# Émojis par type MIME complet, et par type principal pour les clés "video/", "audio/"...
+_EMOJI_BY_MIME = {key: emoji for key, emoji in FILE_EMOJIS.items() if not key.endswith('/')}
+_EMOJI_BY_TOPLEVEL = {key[:-1]: emoji for key, emoji in FILE_EMOJIS.items() if key.endswith('/')}
+
+# Extensions (sans le point, en minuscules) par catégorie de fichier
+_CATEGORY_EXTENSIONS = {
+    'image': ('jpg', 'jpeg', 'png', 'gif', 'bmp', 'svg', 'webp', 'ico'),
+    'document': ('doc', 'docx', 'pdf', 'txt', 'rtf', 'odt'),
+    'audio': ('mp3', 'wav', 'flac', 'aac', 'ogg', 'm4a', 'wma'),
+    'video': ('mp4', 'avi', 'mkv', 'mov', 'wmv', 'flv', 'webm', 'm4v'),
+    'archive': ('zip', 'rar', '7z', 'tar', 'gz', 'bz2', 'xz'),
+}
+
+# Index inversé: extension -> catégorie
+_EXT_TO_CATEGORY = {ext: category
+                    for category, extensions in _CATEGORY_EXTENSIONS.items()
+                    for ext in extensions}
+
+
+def _ext_lower(file_name: str) -> str:
+    """
+    Extension d'un nom de fichier, sans le point et en minuscules
+
+    Seul le suffixe est mis en minuscules. Un nom commençant par un point
+    (".bashrc") n'a pas d'extension, comme avec os.path.splitext.
+    """
+    dot = file_name.rfind('.')
+    if dot <= 0:
+        return ''
+    return file_name[dot + 1:].lower()
+
+
+def file_category(file_name: str) -> Optional[str]:
+    """
+    Retourne la catégorie d'un fichier d'après son extension
+
+    Args:
+        file_name: Nom du fichier
+
+    Returns:
+        'image', 'document', 'audio', 'video', 'archive', ou None si inconnue
+    """
+    return _EXT_TO_CATEGORY.get(_ext_lower(file_name))
+
 
 def format_file_size(size_bytes: int) -> str:
     """
@@ -19,18 +81,20 @@ def format_file_size(size_bytes: int) -> str:
     Returns:
         Taille formatée (ex: "1.5 MB")
     """
-    if size_bytes == 0:
+    # Tailles de l'API Drive reçues en chaîne, vitesses en float
+    size = size_bytes if isinstance(size_bytes, int) else float(size_bytes)
+    if size == 0:
         return "0 B"
+    # Valeurs négatives, inférieures à 1 KB ou nan: en octets, sans conversion
+    if not size >= 1024:
+        return f"{size:.2f} {_SIZE_UNITS[0]}"
+    # int(inf) lèverait OverflowError: l'infini s'affiche dans la plus grande unité
+    if size == math.inf:
+        return f"{size:.2f} {_SIZE_UNITS[-1]}"
 
-    size_names = ("B", "KB", "MB", "GB", "TB")
-    i = 0
-    size = float(size_bytes)
-
-    while size >= 1024 and i < len(size_names) - 1:
-        size /= 1024
-        i += 1
-
-    return f"{size:.2f} {size_names[i]}"
+    # Unité = puissance de 1024 déduite du nombre de bits, une seule division
+    i = min((int(size).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size / (1 << (i * 10)):.2f} {_SIZE_UNITS[i]}"
 
 
 def get_file_emoji(mime_type: str) -> str:
@@ -43,23 +107,49 @@ def get_file_emoji(mime_type: str) -> str:
     Returns:
         Émoji correspondant au type de fichier
     """
-    for mime_key, emoji in FILE_EMOJIS.items():
-        if mime_type.startswith(mime_key):
-            return emoji
-    return '📄'
+    emoji = _EMOJI_BY_MIME.get(mime_type)
+    if emoji is None:
+        emoji = _EMOJI_BY_TOPLEVEL.get(mime_type.partition('/')[0], '📄')
+    return emoji
 
 
+@lru_cache(maxsize=512)
 def get_file_type_description(mime_type: str) -> str:
     """
     Retourne la description du type de fichier
 
+    Mise en cache: les mêmes types MIME reviennent sur toutes les lignes d'un listing.
+
     Args:
         mime_type: Type MIME du fichier
 
     Returns:
         Description du type de fichier
     """
-    return FILE_TYPES.get(mime_type, f"📄 {mime_type.split('/')[-1].upper()}")
+    description = FILE_TYPES.get(mime_type)
+    if description is None:
+        description = f"📄 {mime_type.split('/')[-1].upper()}"
+    return description
+
+
+@lru_cache(maxsize=4096)
+def _format_drive_date(date_str: str) -> str:
+    """
+    Formate une date ISO 8601 de Google Drive (ex: "2023-12-25T10:30:45.123Z")
+
+    Le format de Drive est fixe: date et heure sont extraites par une regex
+    précompilée, sans construire de datetime. fromisoformat (puis strptime)
+    ne sert que pour les formats inattendus; le cache évite de reformater
+    les dates identiques, fréquentes dans un même listing.
+    """
+    match = _DRIVE_TS_RE.match(date_str)
+    if match:
+        return f"{match.group(1)} {match.group(2)}"
+    try:
+        date_obj = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+    except ValueError:
+        date_obj = datetime.strptime(date_str, "%Y-%m-%dT%H:%M:%S.%fZ")
+    return date_obj.strftime("%Y-%m-%d %H:%M")
 
 
 def format_date(date_input) -> str:
@@ -78,8 +168,7 @@ def format_date(date_input) -> str:
     try:
         if isinstance(date_input, str):
             # Format Google Drive: "2023-12-25T10:30:45.123Z"
-            date_obj = datetime.strptime(date_input, "%Y-%m-%dT%H:%M:%S.%fZ")
-            return date_obj.strftime("%Y-%m-%d %H:%M")
+            return _format_drive_date(date_input)
         elif isinstance(date_input, (int, float)):
             # Timestamp Unix
             date_obj = datetime.fromtimestamp(date_input)
@@ -100,8 +189,7 @@ def is_image_file(file_name: str) -> bool:
     Returns:
         True si c'est une image, False sinon
     """
-    image_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.svg', '.webp', '.ico'}
-    return os.path.splitext(file_name.lower())[1] in image_extensions
+    return file_category(file_name) == 'image'
 
 
 def is_document_file(file_name: str) -> bool:
@@ -114,8 +202,7 @@ def is_document_file(file_name: str) -> bool:
     Returns:
         True si c'est un document, False sinon
     """
-    document_extensions = {'.doc', '.docx', '.pdf', '.txt', '.rtf', '.odt'}
-    return os.path.splitext(file_name.lower())[1] in document_extensions
+    return file_category(file_name) == 'document'
 
 
 def is_audio_file(file_name: str) -> bool:
@@ -128,8 +215,7 @@ def is_audio_file(file_name: str) -> bool:
     Returns:
         True si c'est un fichier audio, False sinon
     """
-    audio_extensions = {'.mp3', '.wav', '.flac', '.aac', '.ogg', '.m4a', '.wma'}
-    return os.path.splitext(file_name.lower())[1] in audio_extensions
+    return file_category(file_name) == 'audio'
 
 
 def is_video_file(file_name: str) -> bool:
@@ -142,8 +228,7 @@ def is_video_file(file_name: str) -> bool:
     Returns:
         True si c'est une vidéo, False sinon
     """
-    video_extensions = {'.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm', '.m4v'}
-    return os.path.splitext(file_name.lower())[1] in video_extensions
+    return file_category(file_name) == 'video'
 
 
 def is_archive_file(file_name: str) -> bool:
@@ -156,8 +241,7 @@ def is_archive_file(file_name: str) -> bool:
     Returns:
         True si c'est une archive, False sinon
     """
-    archive_extensions = {'.zip', '.rar', '.7z', '.tar', '.gz', '.bz2', '.xz'}
-    return os.path.splitext(file_name.lower())[1] in archive_extensions
+    return file_category(file_name) == 'archive'
 
 
 def sanitize_filename(filename: str) -> str:
@@ -170,25 +254,13 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         Nom de fichier nettoyé
     """
-    # Caractères interdits sur Windows et autres systèmes
-    forbidden_chars = '<>:"/\\|?*'
-
-    # Remplacer les caractères interdits par des underscores
-    for char in forbidden_chars:
-        filename = filename.replace(char, '_')
-
-    # Supprimer les espaces en début/fin
-    filename = filename.strip()
+    # Remplacer les caractères interdits par des underscores (une seule passe),
+    # puis supprimer les espaces en début/fin
+    filename = filename.translate(_SANITIZE_TABLE).strip()
 
     # Éviter les noms réservés sur Windows
-    reserved_names = {
-        'CON', 'PRN', 'AUX', 'NUL',
-        'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
-        'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'
-    }
-
     base_name = os.path.splitext(filename)[0].upper()
-    if base_name in reserved_names:
+    if base_name in _RESERVED_NAMES:
         filename = f"_{filename}"
 
     return filename
@@ -252,16 +324,22 @@ def get_directory_size(path: str) -> int:
         Taille totale en bytes
     """
     total_size = 0
-    try:
-        for dirpath, dirnames, filenames in os.walk(path):
-            for filename in filenames:
-                file_path = os.path.join(dirpath, filename)
-                try:
-                    total_size += os.path.getsize(file_path)
-                except (OSError, IOError):
-                    pass
-    except Exception:
-        pass
+    # Parcours itératif avec os.scandir: le type et la taille viennent du
+    # listing du dossier (DirEntry), sans stat supplémentaire par fichier
+    pending = [path]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file(follow_symlinks=False):
+                            total_size += entry.stat(follow_symlinks=False).st_size
+                        elif entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                    except OSError:
+                        pass
+        except OSError:
+            pass
     return total_size
 
 
@@ -279,12 +357,16 @@ def count_files_in_directory(path: str) -> dict:
     dir_count = 0
 
     try:
-        for item in os.listdir(path):
-            item_path = os.path.join(path, item)
-            if os.path.isfile(item_path):
-                file_count += 1
-            elif os.path.isdir(item_path):
-                dir_count += 1
+        # Le type vient du listing (DirEntry): pas de stat par élément, sauf liens symboliques
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_file():
+                        file_count += 1
+                    elif entry.is_dir():
+                        dir_count += 1
+                except OSError:
+                    pass
     except Exception:
         pass
 
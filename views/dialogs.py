@@ -2,18 +2,86 @@
 Boîtes de dialogue personnalisées pour l'application
 """
 
-from datetime import datetime
+import bisect
+from time import monotonic_ns
+
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
                              QLineEdit, QPushButton, QDialogButtonBox,
-                             QFormLayout, QTextEdit, QMessageBox)
-from PyQt5.QtCore import Qt
-
-from utils.helpers import format_file_size, get_file_type_description
-
-
-class SearchDialog(QDialog):
+                             QFormLayout, QMessageBox,
+                             QProgressBar, QSpinBox, QGroupBox, QCheckBox,
+                             QGridLayout, QWidget)
+from PyQt5.QtCore import Qt, QTimer
+
+from config.settings import (MIN_NUM_WORKERS, MAX_NUM_WORKERS,
+                             MIN_FILES_PER_WORKER, MAX_FILES_PER_WORKER,
+                             DEFAULT_NUM_WORKERS, DEFAULT_FILES_PER_WORKER)
+from utils.helpers import format_date, format_file_size, get_file_type_description
+
+# Libellés des détails d'un fichier et suffixes des compteurs, créés une fois à l'import
+_LBL_NAME = "📄 Nom:"
+_LBL_ID = "🆔 ID:"
+_LBL_TYPE = "🏷️ Type:"
+_LBL_SIZE = "📏 Taille:"
+_LBL_MODIFIED = "📅 Modifié le:"
+_LBL_DESCRIPTION = "📝 Description:"
+_LBL_DRIVE_ID = "☁️ Drive ID:"
+_SUFFIX_WORKERS = " workers"
+_SUFFIX_FILES = " fichiers"
+
+# Intervalle minimal entre deux rafraîchissements de ProgressDialog (50 ms)
+_PROGRESS_PAINT_INTERVAL_NS = 50_000_000
+
+# Recommandation selon le total d'uploads parallèles: (seuil inclus, message)
+_RECO_TABLE = (
+    (5, "💚 Léger - Idéal pour préserver les ressources"),
+    (10, "🟡 Modéré - Bon équilibre performance/ressources"),
+    (15, "🟠 Intense - Bonnes performances, ressources élevées"),
+    (10 ** 9, "🔴 Maximum - Performances maximales, très gourmand"),
+)
+_RECO_KEYS = [threshold for threshold, _ in _RECO_TABLE]
+
+# Feuilles de style précalculées: Qt ne réanalyse pas un QSS construit à chaque mise à jour
+_QSS_GREEN = "color: green; font-weight: bold;"
+_QSS_ORANGE = "color: orange; font-weight: bold;"
+_QSS_RED = "color: red; font-weight: bold;"
+_QSS_BY_BUCKET = (_QSS_GREEN, _QSS_ORANGE, _QSS_RED)
+_QSS_TITLE = "font-size: 14px; font-weight: bold; margin-bottom: 10px;"
+_QSS_DESCRIPTION = "color: #666; margin-bottom: 15px;"
+_QSS_FOLDER_EXPLANATION = "color: #666; margin-top: 5px;"
+
+# Seuils (inclus) de charge associés à _QSS_BY_BUCKET
+_LOAD_BUCKET_KEYS = [5, 15, 10 ** 9]
+
+
+class LazySetupMixin:
+    """
+    Construit l'interface (setup_ui) au premier affichage plutôt qu'à la création
+
+    setup_ui est appelé juste avant que le dialogue devienne visible, donc avant
+    son dimensionnement et son positionnement par Qt. Les accesseurs qui lisent
+    des widgets appellent ensure_ui() pour fonctionner même sans affichage.
+    """
+
+    _ui_built = False
+
+    def ensure_ui(self) -> None:
+        """Construit l'interface si ce n'est pas déjà fait"""
+        if not self._ui_built:
+            self._ui_built = True
+            self.setup_ui()
+
+    def setVisible(self, visible: bool) -> None:
+        if visible:
+            self.ensure_ui()
+        super().setVisible(visible)
+
+
+class SearchDialog(LazySetupMixin, QDialog):
     """Boîte de dialogue pour la recherche de fichiers"""
 
+    # Texte saisi, mémorisé à la validation
+    _cached_text = None
+
     def __init__(self, parent=None):
         """
         Initialise la boîte de dialogue de recherche
@@ -25,7 +93,6 @@ class SearchDialog(QDialog):
         self.setWindowTitle("🔍 Rechercher dans Google Drive")
         self.setModal(True)
         self.resize(400, 150)
-        self.setup_ui()
 
     def setup_ui(self) -> None:
         """Configure l'interface utilisateur"""
@@ -66,10 +133,18 @@ class SearchDialog(QDialog):
         Returns:
             Texte de recherche saisi par l'utilisateur
         """
+        if self._cached_text is not None:
+            return self._cached_text
+        self.ensure_ui()
         return self.search_edit.text().strip()
 
+    def accept(self) -> None:
+        """Mémorise le texte de recherche validé avant de fermer la boîte de dialogue"""
+        self._cached_text = self.search_edit.text().strip()
+        super().accept()
+
 
-class FileDetailsDialog(QDialog):
+class FileDetailsDialog(LazySetupMixin, QDialog):
     """Boîte de dialogue pour afficher les détails d'un fichier"""
 
     def __init__(self, file_metadata: dict, parent=None):
@@ -86,50 +161,48 @@ class FileDetailsDialog(QDialog):
         self.setWindowTitle(f"ℹ️ Propriétés: {file_name}")
         self.setModal(True)
         self.resize(500, 400)
-        self.setup_ui()
 
     def setup_ui(self) -> None:
         """Configure l'interface utilisateur"""
         layout = QVBoxLayout()
 
-        # Formulaire avec les détails
-        form_layout = QFormLayout()
-
-        # Informations de base avec émojis
-        form_layout.addRow("📄 Nom:", QLabel(self.file_metadata.get('name', '')))
-        form_layout.addRow("🆔 ID:", QLabel(self.file_metadata.get('id', '')))
-
-        mime_type = self.file_metadata.get('mimeType', '')
-        form_layout.addRow("🏷️ Type:", QLabel(get_file_type_description(mime_type)))
-
-        # Taille si disponible
-        if 'size' in self.file_metadata:
-            size_bytes = int(self.file_metadata.get('size', 0))
-            form_layout.addRow("📏 Taille:", QLabel(format_file_size(size_bytes)))
-
-        # Date de modification
-        if 'modifiedTime' in self.file_metadata:
-            try:
-                date_obj = datetime.strptime(
-                    self.file_metadata['modifiedTime'],
-                    "%Y-%m-%dT%H:%M:%S.%fZ"
-                )
-                date_str = date_obj.strftime("%Y-%m-%d %H:%M")
-            except Exception:
-                date_str = self.file_metadata['modifiedTime']
-            form_layout.addRow("📅 Modifié le:", QLabel(date_str))
-
-        # Description si disponible
-        if 'description' in self.file_metadata and self.file_metadata['description']:
-            desc_label = QLabel(self.file_metadata['description'])
+        # Grille avec les détails: lignes et colonnes placées explicitement
+        grid = QGridLayout()
+        grid.setColumnStretch(1, 1)
+
+        md = self.file_metadata
+
+        # Lignes (libellé, texte ou QLabel déjà construit), filtrées sur les clés présentes
+        rows = [
+            (_LBL_NAME, md.get('name', '')),
+            (_LBL_ID, md.get('id', '')),
+            (_LBL_TYPE, get_file_type_description(md.get('mimeType', ''))),
+        ]
+        size = md.get('size')
+        if size is not None:
+            rows.append((_LBL_SIZE, format_file_size(int(size))))
+        modified_time = md.get('modifiedTime')
+        if modified_time is not None:
+            rows.append((_LBL_MODIFIED, format_date(modified_time)))
+        description = md.get('description')
+        if description:
+            desc_label = QLabel(description)
             desc_label.setWordWrap(True)
-            form_layout.addRow("📝 Description:", desc_label)
-
-        # Drive ID si disponible
-        if 'driveId' in self.file_metadata:
-            form_layout.addRow("☁️ Drive ID:", QLabel(self.file_metadata['driveId']))
-
-        layout.addLayout(form_layout)
+            rows.append((_LBL_DESCRIPTION, desc_label))
+        drive_id = md.get('driveId')
+        if drive_id is not None:
+            rows.append((_LBL_DRIVE_ID, drive_id))
+
+        # Un seul passage de mise en page pour toutes les lignes
+        self.setUpdatesEnabled(False)
+        try:
+            for row, (label, value) in enumerate(rows):
+                grid.addWidget(QLabel(label), row, 0, Qt.AlignTop)
+                grid.addWidget(value if isinstance(value, QWidget) else QLabel(value), row, 1)
+        finally:
+            self.setUpdatesEnabled(True)
+
+        layout.addLayout(grid)
 
         # Bouton OK
         button_box = QDialogButtonBox(QDialogButtonBox.Ok)
@@ -139,9 +212,12 @@ class FileDetailsDialog(QDialog):
         self.setLayout(layout)
 
 
-class RenameDialog(QDialog):
+class RenameDialog(LazySetupMixin, QDialog):
     """Boîte de dialogue pour renommer un fichier/dossier"""
 
+    # Texte saisi, mémorisé à la validation
+    _cached_text = None
+
     def __init__(self, current_name: str, parent=None):
         """
         Initialise la boîte de dialogue de renommage
@@ -155,7 +231,6 @@ class RenameDialog(QDialog):
         self.setWindowTitle("✏️ Renommer")
         self.setModal(True)
         self.resize(400, 120)
-        self.setup_ui()
 
     def setup_ui(self) -> None:
         """Configure l'interface utilisateur"""
@@ -187,12 +262,23 @@ class RenameDialog(QDialog):
         Returns:
             Nouveau nom du fichier/dossier
         """
+        if self._cached_text is not None:
+            return self._cached_text
+        self.ensure_ui()
         return self.name_edit.text().strip()
 
+    def accept(self) -> None:
+        """Mémorise le nouveau nom validé avant de fermer la boîte de dialogue"""
+        self._cached_text = self.name_edit.text().strip()
+        super().accept()
+
 
-class CreateFolderDialog(QDialog):
+class CreateFolderDialog(LazySetupMixin, QDialog):
     """Boîte de dialogue pour créer un nouveau dossier"""
 
+    # Texte saisi, mémorisé à la validation
+    _cached_text = None
+
     def __init__(self, parent=None, title: str = "📁 Nouveau dossier"):
         """
         Initialise la boîte de dialogue de création de dossier
@@ -205,7 +291,6 @@ class CreateFolderDialog(QDialog):
         self.setWindowTitle(title)
         self.setModal(True)
         self.resize(400, 120)
-        self.setup_ui()
 
     def setup_ui(self) -> None:
         """Configure l'interface utilisateur"""
@@ -237,8 +322,16 @@ class CreateFolderDialog(QDialog):
         Returns:
             Nom du dossier à créer
         """
+        if self._cached_text is not None:
+            return self._cached_text
+        self.ensure_ui()
         return self.folder_name_edit.text().strip()
 
+    def accept(self) -> None:
+        """Mémorise le nom de dossier validé avant de fermer la boîte de dialogue"""
+        self._cached_text = self.folder_name_edit.text().strip()
+        super().accept()
+
 
 class ConfirmationDialog(QMessageBox):
     """Boîte de dialogue de confirmation personnalisée"""
@@ -313,7 +406,7 @@ class ErrorDialog(QMessageBox):
         dialog.exec_()
 
 
-class ProgressDialog(QDialog):
+class ProgressDialog(LazySetupMixin, QDialog):
     """Boîte de dialogue de progression pour les opérations longues"""
 
     def __init__(self, title: str, parent=None):
@@ -328,7 +421,15 @@ class ProgressDialog(QDialog):
         self.setWindowTitle(title)
         self.setModal(True)
         self.setFixedSize(400, 120)
-        self.setup_ui()
+
+        # Limitation des rafraîchissements: la dernière valeur reçue est gardée
+        # et affichée au plus tard à la fin de l'intervalle
+        self._last_paint_ns = 0
+        self._pending_value = None
+        self._pending_status = None
+        self._paint_timer = QTimer(self)
+        self._paint_timer.setSingleShot(True)
+        self._paint_timer.timeout.connect(self._paint_pending)
 
     def setup_ui(self) -> None:
         """Configure l'interface utilisateur"""
@@ -339,7 +440,6 @@ class ProgressDialog(QDialog):
         layout.addWidget(self.status_label)
 
         # Barre de progression
-        from PyQt5.QtWidgets import QProgressBar
         self.progress_bar = QProgressBar()
         self.progress_bar.setRange(0, 100)
         self.progress_bar.setValue(0)
@@ -360,9 +460,10 @@ class ProgressDialog(QDialog):
             value: Valeur de progression (0-100)
             status: Message de statut (optionnel)
         """
-        self.progress_bar.setValue(value)
+        self._pending_value = value
         if status:
-            self.status_label.setText(status)
+            self._pending_status = status
+        self._schedule_paint(force=value >= 100)
 
     def set_status(self, status: str) -> None:
         """
@@ -371,10 +472,42 @@ class ProgressDialog(QDialog):
         Args:
             status: Nouveau message de statut
         """
-        self.status_label.setText(status)
+        self._pending_status = status
+        self._schedule_paint()
 
+    def _schedule_paint(self, force: bool = False) -> None:
+        """
+        Affiche les valeurs en attente, au plus une fois par intervalle
 
-class UploadConfigDialog(QDialog):
+        Args:
+            force: Afficher immédiatement (ex: progression terminée)
+        """
+        elapsed = monotonic_ns() - self._last_paint_ns
+        if force or elapsed > _PROGRESS_PAINT_INTERVAL_NS:
+            self._paint_timer.stop()
+            self._paint_pending()
+        elif not self._paint_timer.isActive():
+            self._paint_timer.start((_PROGRESS_PAINT_INTERVAL_NS - elapsed) // 1_000_000 + 1)
+
+    def _paint_pending(self) -> None:
+        """Applique aux widgets la dernière progression et le dernier statut reçus"""
+        self.ensure_ui()
+        self._last_paint_ns = monotonic_ns()
+        # Barre et libellé modifiés ensemble: un seul rafraîchissement pour les deux
+        self.setUpdatesEnabled(False)
+        try:
+            if self._pending_value is not None:
+                self.progress_bar.setValue(self._pending_value)
+                self._pending_value = None
+            if self._pending_status is not None:
+                self.status_label.setText(self._pending_status)
+                self._pending_status = None
+        finally:
+            self.setUpdatesEnabled(True)
+        self.update()
+
+
+class UploadConfigDialog(LazySetupMixin, QDialog):
     """Boîte de dialogue pour configurer les paramètres d'upload"""
 
     def __init__(self, current_workers: int = 2, current_files_per_worker: int = 5, 
@@ -399,26 +532,27 @@ class UploadConfigDialog(QDialog):
         self.current_files_per_worker = current_files_per_worker
         self.use_existing_folders = use_existing_folders
 
-        self.setup_ui()
-
     def setup_ui(self) -> None:
         """Configure l'interface utilisateur"""
-        from PyQt5.QtWidgets import QSpinBox, QGroupBox, QCheckBox
-        from config.settings import (MIN_NUM_WORKERS, MAX_NUM_WORKERS, 
-                                    MIN_FILES_PER_WORKER, MAX_FILES_PER_WORKER)
-
         layout = QVBoxLayout()
 
         # Titre et description
         title_label = QLabel("Configuration du Système d'Upload")
-        title_label.setStyleSheet("font-size: 14px; font-weight: bold; margin-bottom: 10px;")
+        title_label.setStyleSheet(_QSS_TITLE)
         layout.addWidget(title_label)
 
         desc_label = QLabel("Configurez les paramètres d'upload et de gestion des dossiers.")
         desc_label.setWordWrap(True)
-        desc_label.setStyleSheet("color: #666; margin-bottom: 15px;")
+        desc_label.setStyleSheet(_QSS_DESCRIPTION)
         layout.addWidget(desc_label)
 
+        # Recalcul différé: une rafale de valueChanged (molette, flèche maintenue)
+        # ne déclenche qu'une seule mise à jour des libellés
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(30)
+        self._update_timer.timeout.connect(self._update_total_parallel)
+
         # Groupe de configuration des workers
         workers_group = QGroupBox("Configuration des Workers")
         workers_layout = QFormLayout()
@@ -427,16 +561,16 @@ class UploadConfigDialog(QDialog):
         self.workers_spinbox = QSpinBox()
         self.workers_spinbox.setRange(MIN_NUM_WORKERS, MAX_NUM_WORKERS)
         self.workers_spinbox.setValue(self.current_workers)
-        self.workers_spinbox.setSuffix(" workers")
-        self.workers_spinbox.valueChanged.connect(self._update_total_parallel)
+        self.workers_spinbox.setSuffix(_SUFFIX_WORKERS)
+        self.workers_spinbox.valueChanged.connect(lambda _value: self._update_timer.start())
         workers_layout.addRow("Nombre de workers:", self.workers_spinbox)
 
         # Fichiers par worker
         self.files_per_worker_spinbox = QSpinBox()
         self.files_per_worker_spinbox.setRange(MIN_FILES_PER_WORKER, MAX_FILES_PER_WORKER)
         self.files_per_worker_spinbox.setValue(self.current_files_per_worker)
-        self.files_per_worker_spinbox.setSuffix(" fichiers")
-        self.files_per_worker_spinbox.valueChanged.connect(self._update_total_parallel)
+        self.files_per_worker_spinbox.setSuffix(_SUFFIX_FILES)
+        self.files_per_worker_spinbox.valueChanged.connect(lambda _value: self._update_timer.start())
         workers_layout.addRow("Fichiers par worker:", self.files_per_worker_spinbox)
 
         workers_group.setLayout(workers_layout)
@@ -473,24 +607,12 @@ class UploadConfigDialog(QDialog):
             "• Si coché: Utilise les dossiers existants quand ils sont trouvés\n"
             "• Si non coché: Crée de nouveaux dossiers même si un dossier du même nom existe déjà"
         )
-        folder_explanation.setStyleSheet("color: #666; margin-top: 5px;")
+        folder_explanation.setStyleSheet(_QSS_FOLDER_EXPLANATION)
         folders_layout.addWidget(folder_explanation)
 
         folders_group.setLayout(folders_layout)
         layout.addWidget(folders_group)
 
-        # Explication
-        explanation_label = QLabel(
-            "<b>Conseils:</b><br>"
-            "• Plus de workers = plus de parallélisme mais plus de ressources CPU/RAM<br>"
-            "• Plus de fichiers par worker = plus d'uploads simultanés<br>"
-            "• Valeurs recommandées: 2-3 workers avec 5-10 fichiers par worker<br>"
-            "• Pour gros volumes: réduisez les valeurs pour économiser les ressources"
-        )
-        explanation_label.setWordWrap(True)
-        explanation_label.setStyleSheet("background-color: darkGray; color: white; padding: 10px; border-radius: 5px; margin: 10px 0;")
-        # layout.addWidget(explanation_label)
-
         # Boutons
         button_layout = QHBoxLayout()
 
@@ -515,35 +637,19 @@ class UploadConfigDialog(QDialog):
         self.total_parallel_label.setText(f"<b>{total}</b> fichiers simultanés")
 
         # Couleur basée sur la charge
-        if total <= 5:
-            color = "green"
-        elif total <= 15:
-            color = "orange"
-        else:
-            color = "red"
-
-        self.total_parallel_label.setStyleSheet(f"color: {color}; font-weight: bold;")
+        idx = bisect.bisect_left(_LOAD_BUCKET_KEYS, total)
+        self.total_parallel_label.setStyleSheet(_QSS_BY_BUCKET[idx])
         self._update_recommendation()
 
     def _update_recommendation(self) -> None:
         """Met à jour la recommandation basée sur les valeurs actuelles"""
         total = self.workers_spinbox.value() * self.files_per_worker_spinbox.value()
 
-        if total <= 5:
-            recommendation = "💚 Léger - Idéal pour préserver les ressources"
-        elif total <= 10:
-            recommendation = "🟡 Modéré - Bon équilibre performance/ressources"
-        elif total <= 15:
-            recommendation = "🟠 Intense - Bonnes performances, ressources élevées"
-        else:
-            recommendation = "🔴 Maximum - Performances maximales, très gourmand"
-
-        self.recommendation_label.setText(recommendation)
+        idx = bisect.bisect_left(_RECO_KEYS, total)
+        self.recommendation_label.setText(_RECO_TABLE[idx][1])
 
     def _reset_to_defaults(self) -> None:
         """Remet les valeurs par défaut"""
-        from config.settings import DEFAULT_NUM_WORKERS, DEFAULT_FILES_PER_WORKER
-
         self.workers_spinbox.setValue(DEFAULT_NUM_WORKERS)
         self.files_per_worker_spinbox.setValue(DEFAULT_FILES_PER_WORKER)
         self.use_existing_folders_checkbox.setChecked(True)  # Valeur par défaut: utiliser les dossiers existants
@@ -555,6 +661,7 @@ class UploadConfigDialog(QDialog):
         Returns:
             Tuple (num_workers, files_per_worker)
         """
+        self.ensure_ui()
         return (self.workers_spinbox.value(), self.files_per_worker_spinbox.value())
 
     def get_use_existing_folders(self) -> bool:
@@ -564,6 +671,7 @@ class UploadConfigDialog(QDialog):
         Returns:
             True si les dossiers existants doivent être utilisés, False sinon
         """
+        self.ensure_ui()
         return self.use_existing_folders_checkbox.isChecked()
 
 
@@ -4,6 +4,7 @@ Fenêtre principale de l'application Google Drive Explorer avec interface à ong
 
 import os
 import shutil
+import stat
 import subprocess
 import sys
 from typing import List, Dict, Any, Optional
@@ -13,13 +14,15 @@ from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                              QProgressBar, QLineEdit, QComboBox, QApplication,
                              QTabWidget)
 from PyQt5.QtCore import Qt, QSize, QTimer, pyqtSignal
-from PyQt5.QtGui import QKeySequence, QIcon
+from PyQt5.QtGui import QKeySequence, QIcon, QStandardItem
 
 from config.settings import (WINDOW_TITLE, WINDOW_WIDTH, WINDOW_HEIGHT,
                              TOOLBAR_ICON_SIZE, CACHE_CLEANUP_INTERVAL_MS, get_appIcon_path, APP_VERSION)
 from core.cache_manager import CacheManager
 from core.google_drive_client import GoogleDriveClient
+from core.shared_session import reset_shared_session
 from threads import DownloadThread
+from threads.transfer_threads import SafeGoogleDriveUploader
 from threads.file_load_threads import LocalFileLoadThread, DriveFileLoadThread
 from models.file_models import FileListModel, LocalFileModel
 from models.unified_upload_manager import UnifiedUploadManager
@@ -104,6 +107,10 @@ class DriveExplorerMainWindow(QMainWindow):
 
             # Initialize Google Drive client
             self.drive_client = GoogleDriveClient()
+            # Les uploads et la session HTTP partagée reprennent les credentials
+            # du compte qui vient de se connecter
+            SafeGoogleDriveUploader.reset_credentials()
+            reset_shared_session()
             self.connected = True
             print("✅ Connexion à Google Drive réussie")
 
@@ -771,9 +778,9 @@ class DriveExplorerMainWindow(QMainWindow):
             self.status_bar.showMessage("📋 Données du cache affichées - Actualisation en cours...", 2000)
 
         # Lancer le chargement en arrière-plan
-        if self.local_load_thread and self.local_load_thread.isRunning():
-            self.local_load_thread.terminate()
-            self.local_load_thread.wait()
+        # Annuler le chargement précédent sans l'attendre: il s'arrête de lui-même
+        if self.local_load_thread:
+            self.local_load_thread.cancel()
 
         self.local_load_thread = LocalFileLoadThread(target_path)
         self.local_load_thread.files_loaded.connect(self.on_local_files_loaded)
@@ -792,12 +799,34 @@ class DriveExplorerMainWindow(QMainWindow):
         if path == self.local_model.current_path:
             ErrorDialog.show_error("❌ Erreur", f"Impossible de lister les fichiers: {error_msg}", parent=self)
 
+    def _reset_model_rows(self, model, headers: List[str], rows: List[List[QStandardItem]]) -> None:
+        """
+        Remplace tout le contenu d'un modèle en une seule réinitialisation
+
+        Les lignes sont ajoutées signaux bloqués: les vues ne reçoivent qu'un
+        modelReset au lieu d'un rowsInserted (et d'une mise en page) par ligne.
+
+        Args:
+            model: Modèle à remplir
+            headers: Libellés des colonnes
+            rows: Lignes préconstruites (une liste d'items par ligne)
+        """
+        model.beginResetModel()
+        model.blockSignals(True)
+        try:
+            model.clear()
+            model.setHorizontalHeaderLabels(headers)
+            append_row = model.appendRow
+            for row in rows:
+                append_row(row)
+        finally:
+            model.blockSignals(False)
+            model.endResetModel()
+
     def populate_local_model(self, file_list: List[Dict[str, Any]], from_cache: bool = False) -> None:
         """Remplit le modèle local avec les données stylées"""
-        from PyQt5.QtGui import QStandardItem
-
-        self.local_model.clear()
-        self.local_model.setHorizontalHeaderLabels(["Nom", "Taille", "Date de modification", "Type", "Statut"])
+        status_text = "📋 Cache" if from_cache else "✅ Frais"
+        rows = []
 
         for file_info in file_list:
             if file_info['type'] == 'parent':
@@ -817,8 +846,10 @@ class DriveExplorerMainWindow(QMainWindow):
                 ext = os.path.splitext(file_info['name'])[1]
                 type_item = QStandardItem(f"📄 {ext[1:].upper() if ext else 'Fichier'}")
 
-            status_item = QStandardItem("📋 Cache" if from_cache else "✅ Frais")
-            self.local_model.appendRow([name_item, size_item, date_item, type_item, status_item])
+            rows.append([name_item, size_item, date_item, type_item, QStandardItem(status_text)])
+
+        self._reset_model_rows(self.local_model,
+                               ["Nom", "Taille", "Date de modification", "Type", "Statut"], rows)
 
     # ==================== GESTION DE GOOGLE DRIVE ====================
 
@@ -843,9 +874,9 @@ class DriveExplorerMainWindow(QMainWindow):
             self.status_bar.showMessage("📋 Données du cache affichées - Actualisation en cours...", 2000)
 
         # Lancer le chargement en arrière-plan
-        if self.drive_load_thread and self.drive_load_thread.isRunning():
-            self.drive_load_thread.terminate()
-            self.drive_load_thread.wait()
+        # Annuler le chargement précédent sans l'attendre: il s'arrête de lui-même
+        if self.drive_load_thread:
+            self.drive_load_thread.cancel()
 
         self.drive_load_thread = DriveFileLoadThread(
             self.drive_client,
@@ -870,37 +901,33 @@ class DriveExplorerMainWindow(QMainWindow):
 
     def populate_drive_model(self, file_list: List[Dict[str, Any]], from_cache: bool = False) -> None:
         """Remplit le modèle Google Drive avec les données stylées"""
-        from PyQt5.QtGui import QStandardItem
-
-        self.drive_model.clear()
-        self.drive_model.setHorizontalHeaderLabels(["Nom", "Taille", "Date de modification", "Type", "ID", "Statut"])
-
         # Mettre à jour le label de chemin
         self.drive_path_label.setText(self.drive_model.get_path_string())
 
+        status_text = "📋 Cache" if from_cache else "✅ Frais"
+        rows = []
+
         for file_info in file_list:
             if file_info['type'] == 'parent':
                 name_item = QStandardItem("📁 ..")
                 size_item = QStandardItem("")
-                date_item = QStandardItem("")
                 type_item = QStandardItem("📂 Dossier parent")
-                id_item = QStandardItem(file_info.get('id', ''))
             elif file_info['is_dir']:
                 name_item = QStandardItem(f"📁 {file_info['name']}")
                 size_item = QStandardItem("")
                 type_item = QStandardItem("📂 Dossier")
-                id_item = QStandardItem(file_info.get('id', ''))
             else:
-                emoji = get_file_emoji(file_info.get('mimeType', ''))
-                name_item = QStandardItem(f"{emoji} {file_info['name']}")
+                mime_type = file_info.get('mimeType', '')
+                name_item = QStandardItem(f"{get_file_emoji(mime_type)} {file_info['name']}")
                 size_item = QStandardItem(format_file_size(file_info.get('size', 0)))
-                type_item = QStandardItem(get_file_type_description(file_info.get('mimeType', '')))
-                id_item = QStandardItem(file_info.get('id', ''))
+                type_item = QStandardItem(get_file_type_description(mime_type))
 
             date_item = QStandardItem(format_date(file_info.get('modified', '')))
-            status_item = QStandardItem("📋 Cache" if from_cache else "✅ Frais")
+            id_item = QStandardItem(file_info.get('id', ''))
+            rows.append([name_item, size_item, date_item, type_item, id_item, QStandardItem(status_text)])
 
-            self.drive_model.appendRow([name_item, size_item, date_item, type_item, id_item, status_item])
+        self._reset_model_rows(self.drive_model,
+                               ["Nom", "Taille", "Date de modification", "Type", "ID", "Statut"], rows)
 
     # ==================== ACTIONS DE LA BARRE D'OUTILS ====================
 
@@ -985,38 +1012,29 @@ class DriveExplorerMainWindow(QMainWindow):
 
     def display_search_results(self, results: List[Dict[str, Any]], query: str) -> None:
         """Affiche les résultats de recherche"""
-        from PyQt5.QtGui import QStandardItem
-
-        self.drive_model.clear()
-        self.drive_model.setHorizontalHeaderLabels(["Nom", "Taille", "Date de modification", "Type", "ID", "Statut"])
-
         # Ajouter un élément pour revenir à la navigation normale
-        name_item = QStandardItem("🔙 Retour à la navigation")
-        size_item = QStandardItem("")
-        date_item = QStandardItem("")
-        type_item = QStandardItem("🔙 Navigation")
-        id_item = QStandardItem("")
-        status_item = QStandardItem("🔍 Recherche")
-        self.drive_model.appendRow([name_item, size_item, date_item, type_item, id_item, status_item])
+        rows = [[QStandardItem("🔙 Retour à la navigation"), QStandardItem(""), QStandardItem(""),
+                 QStandardItem("🔙 Navigation"), QStandardItem(""), QStandardItem("🔍 Recherche")]]
 
         # Ajouter les résultats
         for file in results:
             name = file.get('name', '')
-            if file.get('mimeType') == 'application/vnd.google-apps.folder':
+            mime_type = file.get('mimeType', '')
+            if mime_type == 'application/vnd.google-apps.folder':
                 name_item = QStandardItem(f"📁 {name}")
                 type_item = QStandardItem("📂 Dossier")
                 size_item = QStandardItem("")
             else:
-                emoji = get_file_emoji(file.get('mimeType', ''))
-                name_item = QStandardItem(f"{emoji} {name}")
-                type_item = QStandardItem(get_file_type_description(file.get('mimeType', '')))
+                name_item = QStandardItem(f"{get_file_emoji(mime_type)} {name}")
+                type_item = QStandardItem(get_file_type_description(mime_type))
                 size_item = QStandardItem(format_file_size(int(file.get('size', 0))))
 
             date_item = QStandardItem(format_date(file.get('modifiedTime', '')))
             id_item = QStandardItem(file.get('id', ''))
-            status_item = QStandardItem("🔍 Recherche")
+            rows.append([name_item, size_item, date_item, type_item, id_item, QStandardItem("🔍 Recherche")])
 
-            self.drive_model.appendRow([name_item, size_item, date_item, type_item, id_item, status_item])
+        self._reset_model_rows(self.drive_model,
+                               ["Nom", "Taille", "Date de modification", "Type", "ID", "Statut"], rows)
 
         self.status_bar.showMessage(f"🔍 {len(results)} résultat(s) pour '{query}'", 5000)
 
@@ -1707,17 +1725,21 @@ class DriveExplorerMainWindow(QMainWindow):
 
             file_path = os.path.join(self.local_model.current_path, clean_name)
 
-            if os.path.exists(file_path):
+            # Un seul stat: existence, type et métadonnées
+            try:
                 stats = os.stat(file_path)
+            except OSError:
+                stats = None
 
+            if stats is not None:
                 # Créer un dictionnaire de métadonnées similaire à Google Drive
                 metadata = {
                     'name': clean_name,
                     'path': file_path,
-                    'size': stats.st_size if os.path.isfile(file_path) else None,
+                    'size': stats.st_size if stat.S_ISREG(stats.st_mode) else None,
                     'modifiedTime': format_date(stats.st_mtime),
                     'createdTime': format_date(stats.st_ctime),
-                    'isDirectory': os.path.isdir(file_path),
+                    'isDirectory': stat.S_ISDIR(stats.st_mode),
                     'permissions': oct(stats.st_mode)[-3:],
                 }
 
@@ -1898,6 +1920,7 @@ class DriveExplorerMainWindow(QMainWindow):
         ):
             if self.drive_client:
                 self.drive_client.disconnect()
+            SafeGoogleDriveUploader.reset_credentials()
             self.connected = False
             self.drive_client = None
             self.drive_model.clear()